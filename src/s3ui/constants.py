@@ -18,12 +18,17 @@ MAX_RETRY_ATTEMPTS = 3
 # Cache defaults
 LISTING_CACHE_MAX_ENTRIES = 30
 LISTING_CACHE_STALE_SECONDS = 30.0
+LISTING_CACHE_MAX_BUCKETS = 8
+MAX_FETCH_THREADS = 16  # enough to saturate object-storage bandwidth
+MAX_CONCURRENT_FETCHES = 8  # in-flight ListObjectsV2 cap, avoids S3 SlowDown
+PREFETCH_CHILD_PREFIXES = 5  # child folders warmed after each listing
 
 # UI defaults
 MIN_WINDOW_WIDTH = 900
 MIN_WINDOW_HEIGHT = 600
 NAV_HISTORY_MAX = 50
 TRANSFER_COALESCE_MS = 100
+FILTER_DEBOUNCE_MS = 120
 
 # Temp directory for quick-open downloads
 TEMP_DIR = APP_DIR / "temp"
@@ -40,6 +40,12 @@ class CostTracker:
     def __init__(self, db: Database, bucket_id: int) -> None:
         self._db = db
         self._bucket_id = bucket_id
+        # Range-query results keyed by (query, bucket, start, end); usage
+        # rows rarely change mid-session, so repeat dashboard opens and
+        # exports skip the day-by-day recomputation. Cleared on every write.
+        self._query_cache: dict[tuple, list] = {}
+        # All cost_rates rows, loaded in one query on first get_rate call
+        self._rates: dict[str, float] | None = None
 
     def record_request(self, request_type: str, count: int = 1) -> None:
         """Record API request(s) for cost tracking."""
@@ -48,6 +54,7 @@ class CostTracker:
             logger.warning("Unknown request type: %s", request_type)
             return
 
+        self._query_cache.clear()
         today = date.today().isoformat()
         self._db.execute(
             f"INSERT INTO daily_usage (bucket_id, usage_date, {column}) "
@@ -58,6 +65,7 @@ class CostTracker:
 
     def record_upload_bytes(self, size: int) -> None:
         """Record bytes uploaded."""
+        self._query_cache.clear()
         today = date.today().isoformat()
         self._db.execute(
             "INSERT INTO daily_usage (bucket_id, usage_date, bytes_uploaded) "
@@ -68,6 +76,7 @@ class CostTracker:
 
     def record_download_bytes(self, size: int) -> None:
         """Record bytes downloaded."""
+        self._query_cache.clear()
         today = date.today().isoformat()
         self._db.execute(
             "INSERT INTO daily_usage (bucket_id, usage_date, bytes_downloaded) "
@@ -79,11 +88,15 @@ class CostTracker:
 
     def get_rate(self, name: str) -> float:
         """Get a cost rate by name."""
-        row = self._db.fetchone("SELECT rate FROM cost_rates WHERE name = ?", (name,))
-        return row["rate"] if row else 0.0
+        if self._rates is None:
+            rows = self._db.fetchall("SELECT name, rate FROM cost_rates")
+            self._rates = {row["name"]: row["rate"] for row in rows}
+        return self._rates.get(name, 0.0)
 
     def set_rate(self, name: str, rate: float) -> None:
         """Update a cost rate."""
+        self._query_cache.clear()
+        self._rates = None
         self._db.execute(
             "UPDATE cost_rates SET rate = ?, updated_at = datetime('now') WHERE name = ?",
             (rate, name),
@@ -103,14 +116,84 @@ class CostTracker:
 
     def get_daily_costs(self, start_date: str, end_date: str) -> list[DailyCost]:
         """Get daily costs for a date range (for charting)."""
+        key = ("daily_costs", self._bucket_id, start_date, end_date)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Two range queries instead of three per day: fetch the usage rows
+        # and every relevant snapshot up front, then walk the snapshot list
+        # alongside the date loop (each day's storage cost comes from the
+        # most recent snapshot at or before it).
+        usage_by_date = {
+            row["usage_date"]: row for row in self.get_usage_rows(start_date, end_date)
+        }
+        snapshots = self._db.fetchall(
+            "SELECT * FROM bucket_snapshots WHERE bucket_id = ? AND snapshot_date <= ? "
+            "ORDER BY snapshot_date",
+            (self._bucket_id, end_date),
+        )
+
         costs = []
+        snap_i = 0
+        storage_cost = 0.0
         current = date.fromisoformat(start_date)
         end = date.fromisoformat(end_date)
         while current <= end:
-            costs.append(self.get_daily_cost(current.isoformat()))
+            target = current.isoformat()
+            advanced = False
+            while snap_i < len(snapshots) and snapshots[snap_i]["snapshot_date"] <= target:
+                snap_i += 1
+                advanced = True
+            if advanced:
+                storage_cost = self._storage_cost_from_snapshot(snapshots[snap_i - 1])
+            row = usage_by_date.get(target)
+            costs.append(
+                DailyCost(
+                    date=target,
+                    storage=storage_cost,
+                    requests=self._request_cost_from_row(row) if row else 0.0,
+                    transfer=self._transfer_cost_from_row(row) if row else 0.0,
+                )
+            )
             current += timedelta(days=1)
+        self._query_cache[key] = costs
         return costs
 
+    def get_dashboard(self, start_date: str, end_date: str) -> tuple[float, list[DailyCost]]:
+        """Monthly estimate plus daily costs for a range, in one call.
+
+        The dialog used to issue these as separate round trips; bundling
+        them keeps the dashboard to a single tracker call and lets the
+        usage-row fetch behind get_daily_costs warm the cache the dialog's
+        usage map reads right after.
+        """
+        return self.get_monthly_estimate(), self.get_daily_costs(start_date, end_date)
+
+    def get_usage_rows(self, start_date: str, end_date: str) -> list:
+        """Raw daily_usage rows for a range, with pre-aggregated totals.
+
+        NULL-coalescing and the request-count sum run inside SQLite's C code
+        rather than per-row Python expressions; the raw columns stay
+        projected for the CSV export.
+        """
+        key = ("usage", self._bucket_id, start_date, end_date)
+        cached = self._query_cache.get(key)
+        if cached is None:
+            cached = self._db.fetchall(
+                "SELECT *, "
+                "COALESCE(put_requests, 0) + COALESCE(get_requests, 0) "
+                "+ COALESCE(list_requests, 0) + COALESCE(delete_requests, 0) "
+                "+ COALESCE(head_requests, 0) + COALESCE(copy_requests, 0) AS total_reqs, "
+                "COALESCE(bytes_uploaded, 0) AS upload, "
+                "COALESCE(bytes_downloaded, 0) AS download "
+                "FROM daily_usage WHERE bucket_id = ? "
+                "AND usage_date >= ? AND usage_date <= ? ORDER BY usage_date",
+                (self._bucket_id, start_date, end_date),
+            )
+            self._query_cache[key] = cached
+        return cached
+
     def get_monthly_estimate(self) -> float:
         """Estimate the current month's total cost."""
         today = date.today()
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 import sys
 from dataclasses import dataclass, field
 
@@ -59,32 +60,64 @@ class TestResult:
     error_detail: str = ""
 
 
-def discover_aws_profiles() -> list[str]:
-    """Discover profile names from ~/.aws/config and ~/.aws/credentials.
+# Parsed profile data keyed on the config files' mtimes. The settings
+# dialog and setup wizard re-discover on every open (and then ask for a
+# region per profile), so without this each dialog open re-parses ~/.aws
+# once per call instead of never.
+_profile_cache: tuple[tuple[int, int], list[str], dict[str, str]] | None = None
 
-    Returns a list of available AWS CLI profile names (e.g., ["default", "work"]).
-    """
+
+def _aws_config_mtimes() -> tuple[int, int]:
+    """st_mtime_ns of the AWS config and credentials files (0 when absent)."""
+    mtimes = []
+    for env_var, default in (
+        ("AWS_CONFIG_FILE", "~/.aws/config"),
+        ("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials"),
+    ):
+        path = os.path.expanduser(os.environ.get(env_var, default))
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return (mtimes[0], mtimes[1])
+
+
+def _discover() -> tuple[list[str], dict[str, str]]:
+    """Profile names and per-profile regions, parsed at most once per config change."""
+    global _profile_cache
+    mtimes = _aws_config_mtimes()
+    if _profile_cache is not None and _profile_cache[0] == mtimes:
+        return _profile_cache[1], _profile_cache[2]
     try:
         import botocore.session
 
         session = botocore.session.Session()
-        profiles = list(session.available_profiles)
+        profiles = sorted(session.available_profiles)
+        # One pass over the parsed config replaces a Session-per-profile
+        # region lookup
+        regions = {
+            name: config.get("region", "")
+            for name, config in session.full_config.get("profiles", {}).items()
+        }
         logger.debug("Discovered %d AWS profiles: %s", len(profiles), profiles)
-        return sorted(profiles)
     except Exception:
         logger.debug("Could not discover AWS profiles", exc_info=True)
-        return []
+        profiles, regions = [], {}
+    _profile_cache = (mtimes, profiles, regions)
+    return profiles, regions
+
+
+def discover_aws_profiles() -> list[str]:
+    """Discover profile names from ~/.aws/config and ~/.aws/credentials.
+
+    Returns a list of available AWS CLI profile names (e.g., ["default", "work"]).
+    """
+    return _discover()[0]
 
 
 def get_aws_profile_region(profile_name: str) -> str:
     """Read the region configured for an AWS CLI profile, or empty string."""
-    try:
-        import botocore.session
-
-        session = botocore.session.Session(profile=profile_name)
-        return session.get_config_variable("region") or ""
-    except Exception:
-        return ""
+    return _discover()[1].get(profile_name, "")
 
 
 class CredentialStore:
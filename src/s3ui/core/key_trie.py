@@ -0,0 +1,62 @@
+"""Character trie over S3 keys for prefix-conflict detection."""
+
+from __future__ import annotations
+
+# Terminal marker under which a key's value is stored. An object() can
+# never collide with a character, so any string is a safe trie key.
+_END = object()
+
+
+class KeyTrie:
+    """Maps keys to values with O(len(key)) ancestor/descendant lookup.
+
+    Built for the operation-lock manager: two keys conflict when one is a
+    prefix of the other (a folder delete blocks uploads beneath it and
+    vice versa). A flat dict needs a startswith scan over every held lock
+    per check; the trie answers in a single walk of the key, independent
+    of how many locks are held.
+    """
+
+    def __init__(self) -> None:
+        self._root: dict = {}
+
+    def insert(self, key: str, value: str) -> None:
+        """Store a value under a key."""
+        node = self._root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[_END] = value
+
+    def remove(self, key: str) -> None:
+        """Remove a key if present, pruning branches left empty."""
+        path = []
+        node = self._root
+        for ch in key:
+            child = node.get(ch)
+            if child is None:
+                return
+            path.append((node, ch))
+            node = child
+        node.pop(_END, None)
+        for parent, ch in reversed(path):
+            if parent[ch]:
+                break
+            del parent[ch]
+
+    def find_conflict(self, key: str) -> str | None:
+        """Value of a stored key that is a prefix of ``key``, equals it,
+        or extends it — or None if no such key exists."""
+        node = self._root
+        for ch in key:
+            if _END in node:
+                return node[_END]  # an ancestor of key is stored
+            node = node.get(ch)
+            if node is None:
+                return None
+        # Full key consumed: every non-empty subtree ends in a stored key,
+        # so anything here or below (key itself or a descendant) conflicts
+        while node:
+            if _END in node:
+                return node[_END]
+            node = next(iter(node.values()))
+        return None
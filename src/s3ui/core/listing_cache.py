@@ -6,10 +6,14 @@ import logging
 import threading
 import time
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from dataclasses import dataclass
 
-from s3ui.constants import LISTING_CACHE_MAX_ENTRIES, LISTING_CACHE_STALE_SECONDS
+from s3ui.constants import (
+    LISTING_CACHE_MAX_BUCKETS,
+    LISTING_CACHE_MAX_ENTRIES,
+    LISTING_CACHE_STALE_SECONDS,
+)
 from s3ui.models.s3_objects import S3Item
 
 logger = logging.getLogger("s3ui.listing_cache")
@@ -36,12 +40,41 @@ class ListingCache:
         self,
         max_entries: int = LISTING_CACHE_MAX_ENTRIES,
         stale_seconds: float = LISTING_CACHE_STALE_SECONDS,
+        max_buckets: int = LISTING_CACHE_MAX_BUCKETS,
     ) -> None:
         self._max_entries = max_entries
         self._stale_seconds = stale_seconds
-        self._cache: OrderedDict[str, CachedListing] = OrderedDict()
+        self._max_buckets = max_buckets
+        # One partition per bucket (LRU over buckets); all prefix-keyed
+        # operations work on the active partition, so switching buckets is a
+        # partition swap rather than a cache wipe
+        self._buckets: OrderedDict[str, OrderedDict[str, CachedListing]] = OrderedDict()
+        self._cache = self._buckets.setdefault("", OrderedDict())
         self._lock = threading.Lock()
 
+    def set_active_bucket(self, bucket: str) -> None:
+        """Switch the active partition, keeping other buckets' entries warm.
+
+        Evicts the least-recently-used bucket partitions beyond the cap so
+        multi-bucket sessions stay bounded.
+        """
+        with self._lock:
+            partition = self._buckets.get(bucket)
+            if partition is None:
+                partition = OrderedDict()
+                self._buckets[bucket] = partition
+            else:
+                self._buckets.move_to_end(bucket)
+            self._cache = partition
+            while len(self._buckets) > self._max_buckets:
+                evicted, _ = self._buckets.popitem(last=False)
+                logger.debug("Evicted bucket partition: '%s'", evicted)
+
+    def __len__(self) -> int:
+        """Number of entries in the active partition."""
+        with self._lock:
+            return len(self._cache)
+
     def get(self, prefix: str) -> CachedListing | None:
         """Get a cached listing, promoting it to MRU. Returns None on miss."""
         with self._lock:
@@ -51,13 +84,21 @@ class ListingCache:
                 return entry
             return None
 
-    def put(self, prefix: str, items: list[S3Item]) -> None:
-        """Store a listing, evicting LRU if over capacity."""
+    def put(self, prefix: str, items: list[S3Item], stale: bool = False) -> None:
+        """Store a listing, evicting LRU if over capacity.
+
+        ``stale=True`` backdates the entry past the stale threshold —
+        used when seeding from the persistent cache, so the listing shows
+        immediately but still revalidates on first navigation.
+        """
+        fetched_at = time.monotonic()
+        if stale:
+            fetched_at -= self._stale_seconds + 1.0
         with self._lock:
             if prefix in self._cache:
                 existing = self._cache[prefix]
                 existing.items = list(items)
-                existing.fetched_at = time.monotonic()
+                existing.fetched_at = fetched_at
                 existing.dirty = False
                 # Don't reset mutation_counter — revalidation handles that
                 self._cache.move_to_end(prefix)
@@ -65,7 +106,7 @@ class ListingCache:
                 self._cache[prefix] = CachedListing(
                     prefix=prefix,
                     items=list(items),
-                    fetched_at=time.monotonic(),
+                    fetched_at=fetched_at,
                 )
             self._evict_if_needed()
 
@@ -78,9 +119,10 @@ class ListingCache:
             return False
 
     def invalidate_all(self) -> None:
-        """Clear the entire cache."""
+        """Clear the entire cache, every bucket partition included."""
         with self._lock:
-            self._cache.clear()
+            for partition in self._buckets.values():
+                partition.clear()
 
     def is_stale(self, prefix: str) -> bool:
         """True if entry is missing or older than stale threshold."""
@@ -106,6 +148,71 @@ class ListingCache:
             entry.mutation_counter += 1
             return True
 
+    def append_item(self, prefix: str, item: S3Item) -> bool:
+        """Append one item to a cached listing (optimistic add).
+
+        Returns False if prefix is not cached.
+        """
+        with self._lock:
+            entry = self._cache.get(prefix)
+            if entry is None:
+                return False
+            entry.items.append(item)
+            entry.dirty = True
+            entry.mutation_counter += 1
+            return True
+
+    def append_items(self, prefix: str, items: list[S3Item]) -> bool:
+        """Append many items under a single mutation-counter bump.
+
+        A concurrent revalidation then sees one consistent snapshot
+        instead of racing N separate mutations.
+        """
+        with self._lock:
+            entry = self._cache.get(prefix)
+            if entry is None:
+                return False
+            entry.items.extend(items)
+            entry.dirty = True
+            entry.mutation_counter += 1
+            return True
+
+    def remove_keys(self, prefix: str, keys: Collection[str]) -> bool:
+        """Remove items by key from a cached listing (optimistic delete).
+
+        ``keys`` may be any container — callers pass a tuple for small
+        deletes, where a linear scan beats building a hash set.
+        """
+        with self._lock:
+            entry = self._cache.get(prefix)
+            if entry is None:
+                return False
+            items = entry.items
+            # Delete matched rows in reverse instead of rebuilding the
+            # whole list; a typical delete touches a few slots of a large
+            # listing rather than reallocating and copying N items
+            to_remove = [i for i, item in enumerate(items) if item.key in keys]
+            for i in reversed(to_remove):
+                del items[i]
+            entry.dirty = True
+            entry.mutation_counter += 1
+            return True
+
+    def rename_key(self, prefix: str, old_key: str, new_key: str, new_name: str) -> bool:
+        """Rename one item in a cached listing (optimistic rename)."""
+        with self._lock:
+            entry = self._cache.get(prefix)
+            if entry is None:
+                return False
+            for item in entry.items:
+                if item.key == old_key:
+                    item.key = new_key
+                    item.name = new_name
+                    break
+            entry.dirty = True
+            entry.mutation_counter += 1
+            return True
+
     def get_mutation_counter(self, prefix: str) -> int:
         """Returns current mutation counter for a prefix. 0 if not cached."""
         with self._lock:
@@ -0,0 +1,88 @@
+"""On-disk spillover for S3 listing results, surviving app restarts."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+
+from s3ui import constants
+from s3ui.models.s3_objects import S3Item
+
+logger = logging.getLogger("s3ui.persistent_cache")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS listings ("
+    "  bucket     TEXT NOT NULL,"
+    "  prefix     TEXT NOT NULL,"
+    "  fetched_at REAL NOT NULL,"
+    "  etag       TEXT NOT NULL,"
+    "  payload    BLOB NOT NULL,"
+    "  PRIMARY KEY (bucket, prefix)"
+    ")"
+)
+
+
+def listing_etag(items: list[S3Item]) -> str:
+    """Weak ETag for a listing: a stable hash over (key, size) pairs.
+
+    Matching etags mean the server listing is unchanged, so revalidation
+    can skip re-diffing the model entirely.
+    """
+    h = hashlib.sha1()
+    for key, size in sorted((item.key, item.size or 0) for item in items):
+        h.update(f"{key}\x00{size}\n".encode())
+    return h.hexdigest()
+
+
+class PersistentListingCache:
+    """SQLite-backed listing store keyed by (bucket, prefix).
+
+    Complements the in-memory ListingCache: entries written here survive
+    restarts and are bulk-loaded (as stale, so they revalidate) when a
+    bucket is opened. Single-threaded by design — all calls come from the
+    GUI thread's fetch-completion handlers.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        if path is None:
+            constants.APP_DIR.mkdir(parents=True, exist_ok=True)
+            path = constants.APP_DIR / "listing_cache.db"
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def load_bucket(self, bucket: str) -> dict[str, list[S3Item]]:
+        """All stored listings for a bucket, keyed by prefix."""
+        rows = self._conn.execute(
+            "SELECT prefix, payload FROM listings WHERE bucket = ?", (bucket,)
+        ).fetchall()
+        listings: dict[str, list[S3Item]] = {}
+        for prefix, payload in rows:
+            try:
+                listings[prefix] = pickle.loads(payload)
+            except Exception:  # corrupt/incompatible row — overwritten on next store
+                logger.warning("Dropping unreadable cached listing for '%s/%s'", bucket, prefix)
+        return listings
+
+    def etag(self, bucket: str, prefix: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT etag FROM listings WHERE bucket = ? AND prefix = ?", (bucket, prefix)
+        ).fetchone()
+        return row[0] if row else None
+
+    def store(self, bucket: str, prefix: str, items: list[S3Item], etag: str | None = None) -> None:
+        payload = pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO listings (bucket, prefix, fetched_at, etag, payload) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (bucket, prefix, time.time(), etag or listing_etag(items), payload),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import boto3
@@ -29,6 +32,20 @@ class S3ClientError(Exception):
 class S3Client:
     """Wraps boto3 S3 client with cost tracking, error translation, and logging."""
 
+    # Process-wide session cache — building a boto3 Session re-parses
+    # ~/.aws/config and credentials on every construction.
+    _session_cache: dict[str, boto3.Session] = {}
+
+    # A first listing page that is truncated and this full signals a large
+    # listing worth paginating in parallel instead of token-by-token.
+    _FANOUT_THRESHOLD = 500
+    _FANOUT_WORKERS = 16
+    # First-character split points (ascending ASCII) that cut the remaining
+    # keyspace into ranges. The choice is only a heuristic for balance —
+    # each range worker pages until it crosses the next boundary, so every
+    # key is covered no matter how names are distributed.
+    _FANOUT_SPLITS = ".05ADGJMPSVY_behknqtwz"
+
     def __init__(
         self,
         profile: Profile,
@@ -36,7 +53,10 @@ class S3Client:
     ) -> None:
         endpoint = profile.endpoint_url or None
         if profile.is_aws_profile:
-            session = boto3.Session(profile_name=profile.name)
+            session = S3Client._session_cache.get(profile.name)
+            if session is None:
+                session = boto3.Session(profile_name=profile.name)
+                S3Client._session_cache[profile.name] = session
             self._client = session.client(
                 "s3",
                 region_name=profile.region or None,
@@ -60,6 +80,11 @@ class S3Client:
             profile.is_aws_profile,
         )
 
+    @property
+    def profile_name(self) -> str:
+        """Name of the profile this client was created for."""
+        return self._profile_name
+
     def set_cost_tracker(self, tracker: CostTracker | None) -> None:
         """Attach or replace the cost tracker (e.g. after bucket selection)."""
         self._cost = tracker
@@ -96,59 +121,195 @@ class S3Client:
     # --- Listing ---
 
     def list_objects(
-        self, bucket: str, prefix: str = "", delimiter: str = "/"
+        self,
+        bucket: str,
+        prefix: str = "",
+        delimiter: str = "/",
+        on_page: Callable[[list[S3Item]], None] | None = None,
     ) -> tuple[list[S3Item], list[str]]:
         """List objects and common prefixes under a prefix.
 
-        Returns (objects, common_prefixes). Handles pagination internally.
+        Returns (objects, common_prefixes). Handles pagination internally;
+        large truncated listings are paged in parallel across lexicographic
+        key ranges instead of serially chasing continuation tokens.
+
+        ``on_page``, if given, is called in this thread with each chunk of
+        converted items as it arrives, so callers can populate a view
+        progressively instead of waiting for the whole listing.
         """
         try:
             logger.debug("list_objects bucket=%s prefix='%s'", bucket, prefix)
             objects: list[S3Item] = []
             prefixes: list[str] = []
 
-            paginator = self._client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter=delimiter)
-
-            page_count = 0
-            for page in pages:
-                page_count += 1
-                self._record("list")
-
-                for obj in page.get("Contents", []):
+            def handle_page(contents: list[dict], common: list[dict]) -> None:
+                start = len(objects)
+                for obj in contents:
                     key = obj["Key"]
                     # Skip the prefix itself (S3 may return the prefix as an object)
                     if key == prefix:
                         continue
                     name = key[len(prefix) :] if prefix else key
+                    # Interning collapses strings that repeat across listing
+                    # generations (names on every revalidation, the handful
+                    # of storage-class values on every object) into one copy
+                    # and makes their comparisons pointer-fast
+                    storage_class = obj.get("StorageClass")
                     objects.append(
                         S3Item(
-                            name=name,
+                            name=sys.intern(name),
                             key=key,
                             is_prefix=False,
                             size=obj.get("Size"),
                             last_modified=obj.get("LastModified"),
-                            storage_class=obj.get("StorageClass"),
+                            storage_class=sys.intern(storage_class) if storage_class else None,
                             etag=obj.get("ETag"),
                         )
                     )
-
-                for cp in page.get("CommonPrefixes", []):
+                for cp in common:
                     p = cp["Prefix"]
                     name = p[len(prefix) :].rstrip("/") if prefix else p.rstrip("/")
                     prefixes.append(p)
-                    objects.append(S3Item(name=name, key=p, is_prefix=True))
+                    objects.append(S3Item(name=sys.intern(name), key=p, is_prefix=True))
+                if on_page is not None and len(objects) > start:
+                    on_page(objects[start:])
+
+            self._record("list")
+            resp = self._client.list_objects_v2(Bucket=bucket, Prefix=prefix, Delimiter=delimiter)
+            contents = resp.get("Contents", [])
+            common = resp.get("CommonPrefixes", [])
+            handle_page(contents, common)
+
+            if resp.get("IsTruncated"):
+                if len(contents) + len(common) >= self._FANOUT_THRESHOLD:
+                    self._list_objects_fanout(
+                        bucket, prefix, delimiter, contents, common, handle_page
+                    )
+                else:
+                    self._list_objects_sequential(
+                        bucket, prefix, delimiter, resp["NextContinuationToken"], handle_page
+                    )
 
             logger.debug(
-                "list_objects returned %d items, %d prefixes across %d pages",
+                "list_objects returned %d items, %d prefixes",
                 len(objects),
                 len(prefixes),
-                page_count,
             )
             return objects, prefixes
         except Exception as e:
             self._handle_error(e, "list_objects")
 
+    def _list_objects_sequential(
+        self,
+        bucket: str,
+        prefix: str,
+        delimiter: str,
+        token: str,
+        handle_page: Callable[[list[dict], list[dict]], None],
+    ) -> None:
+        """Finish a listing the classic way: follow continuation tokens."""
+        while True:
+            self._record("list")
+            resp = self._client.list_objects_v2(
+                Bucket=bucket, Prefix=prefix, Delimiter=delimiter, ContinuationToken=token
+            )
+            handle_page(resp.get("Contents", []), resp.get("CommonPrefixes", []))
+            if not resp.get("IsTruncated"):
+                return
+            token = resp["NextContinuationToken"]
+
+    def _list_objects_fanout(
+        self,
+        bucket: str,
+        prefix: str,
+        delimiter: str,
+        first_contents: list[dict],
+        first_common: list[dict],
+        handle_page: Callable[[list[dict], list[dict]], None],
+    ) -> None:
+        """Page everything after the first listing page in parallel.
+
+        Continuation tokens force strict serial round-trips, so the
+        remaining keyspace is cut at the split characters and each range is
+        paged by its own worker via ``StartAfter``. Ranges are handed to
+        ``handle_page`` in range order (preserving lexicographic order) and
+        deduped by key as a belt-and-braces guard at the boundaries.
+        """
+        last_key = first_contents[-1]["Key"] if first_contents else ""
+        if first_common:
+            last_key = max(last_key, first_common[-1]["Prefix"])
+
+        boundaries = [last_key] + [
+            prefix + c for c in self._FANOUT_SPLITS if prefix + c > last_key
+        ]
+        ranges = [
+            (boundaries[i], boundaries[i + 1] if i + 1 < len(boundaries) else None)
+            for i in range(len(boundaries))
+        ]
+        logger.debug(
+            "list_objects fanout: %d ranges after '%s' for prefix '%s'",
+            len(ranges),
+            last_key,
+            prefix,
+        )
+
+        seen_keys = {obj["Key"] for obj in first_contents}
+        seen_prefixes = {cp["Prefix"] for cp in first_common}
+        with ThreadPoolExecutor(max_workers=self._FANOUT_WORKERS) as pool:
+            futures = [
+                pool.submit(self._list_range, bucket, prefix, delimiter, start, stop)
+                for start, stop in ranges
+            ]
+            for future in futures:
+                range_contents, range_common = future.result()
+                contents = []
+                common = []
+                for obj in range_contents:
+                    if obj["Key"] not in seen_keys:
+                        seen_keys.add(obj["Key"])
+                        contents.append(obj)
+                for cp in range_common:
+                    if cp["Prefix"] not in seen_prefixes:
+                        seen_prefixes.add(cp["Prefix"])
+                        common.append(cp)
+                handle_page(contents, common)
+
+    def _list_range(
+        self, bucket: str, prefix: str, delimiter: str, start: str, stop: str | None
+    ) -> tuple[list[dict], list[dict]]:
+        """Page the lexicographic key range (start, stop] for one fanout worker.
+
+        ``StartAfter`` is exclusive and the stop filter keeps keys equal to
+        the boundary, so adjacent ranges tile the keyspace exactly.
+        """
+        contents: list[dict] = []
+        common: list[dict] = []
+        kwargs = {
+            "Bucket": bucket,
+            "Prefix": prefix,
+            "Delimiter": delimiter,
+            "StartAfter": start,
+        }
+        while True:
+            self._record("list")
+            resp = self._client.list_objects_v2(**kwargs)
+            raw_contents = resp.get("Contents", [])
+            raw_common = resp.get("CommonPrefixes", [])
+            if stop is not None:
+                kept_contents = [o for o in raw_contents if o["Key"] <= stop]
+                kept_common = [p for p in raw_common if p["Prefix"] <= stop]
+                crossed = len(kept_contents) < len(raw_contents) or len(kept_common) < len(
+                    raw_common
+                )
+            else:
+                kept_contents, kept_common, crossed = raw_contents, raw_common, False
+            contents += kept_contents
+            common += kept_common
+            if crossed or not resp.get("IsTruncated"):
+                return contents, common
+            kwargs.pop("StartAfter", None)
+            kwargs["ContinuationToken"] = resp["NextContinuationToken"]
+
     def head_object(self, bucket: str, key: str) -> S3Item:
         """Get full metadata for a single object."""
         try:
@@ -59,7 +59,28 @@ class TransferEngine(QObject):
         if not row:
             logger.warning("Cannot enqueue transfer %d: not found", transfer_id)
             return
+        self._start_worker(row)
 
+    def enqueue_many(self, transfer_ids: list[int]) -> None:
+        """Submit a batch of transfers with a single lookup query."""
+        if not transfer_ids:
+            return
+        placeholders = ",".join("?" * len(transfer_ids))
+        rows = self._db.fetchall(
+            f"SELECT * FROM transfers WHERE id IN ({placeholders})",
+            tuple(transfer_ids),
+        )
+        rows_by_id = {row["id"]: row for row in rows}
+        for transfer_id in transfer_ids:
+            row = rows_by_id.get(transfer_id)
+            if not row:
+                logger.warning("Cannot enqueue transfer %d: not found", transfer_id)
+                continue
+            self._start_worker(row)
+
+    def _start_worker(self, row) -> None:
+        """Create and start a worker for a transfer row."""
+        transfer_id = row["id"]
         pause_evt = threading.Event()
         cancel_evt = threading.Event()
         self._pause_events[transfer_id] = pause_evt
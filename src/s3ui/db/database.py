@@ -1,3 +1,4 @@
+import base64
 import logging
 import sqlite3
 import threading
@@ -116,6 +117,21 @@ def get_pref(db: Database, key: str, default: str | None = None) -> str | None:
     return row["value"] if row else default
 
 
+def get_prefs(db: Database, keys: list[str]) -> dict:
+    """Get several preference values in a single query.
+
+    Returns a dict of the keys that exist; missing keys are absent.
+    """
+    if not keys:
+        return {}
+    placeholders = ",".join("?" * len(keys))
+    rows = db.fetchall(
+        f"SELECT key, value FROM preferences WHERE key IN ({placeholders})",
+        tuple(keys),
+    )
+    return {row["key"]: row["value"] for row in rows}
+
+
 def set_pref(db: Database, key: str, value: str) -> None:
     """Set a preference value."""
     db.execute(
@@ -124,6 +140,46 @@ def set_pref(db: Database, key: str, value: str) -> None:
     )
 
 
+def set_prefs(db: Database, prefs: dict) -> None:
+    """Set several preference values in a single transaction."""
+    if not prefs:
+        return
+    db.executemany(
+        "INSERT OR REPLACE INTO preferences (key, value) VALUES (?, ?)",
+        list(prefs.items()),
+    )
+
+
+def set_blob_pref(db: Database, key: str, value: bytes) -> None:
+    """Set a binary preference value, stored as a raw BLOB."""
+    db.execute(
+        "INSERT OR REPLACE INTO preferences (key, value) VALUES (?, ?)",
+        (key, value),
+    )
+
+
+def blob_value(value: str | bytes | None) -> bytes | None:
+    """Coerce a stored preference value to bytes.
+
+    Values written by older versions were stored as base64 text; those are
+    decoded transparently.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            return base64.b64decode(value)
+        except (ValueError, TypeError):
+            return None
+    return value
+
+
+def get_blob_pref(db: Database, key: str) -> bytes | None:
+    """Get a binary preference value."""
+    row = db.fetchone("SELECT value FROM preferences WHERE key = ?", (key,))
+    return blob_value(row["value"]) if row else None
+
+
 def get_bool_pref(db: Database, key: str, default: bool = False) -> bool:
     """Get a boolean preference."""
     val = get_pref(db, key)
@@ -1,9 +1,25 @@
 """Main application window — dual-pane layout with toolbar, menus, status bar."""
 
+import contextlib
+import functools
 import logging
+import os
+import shutil
 import sys
-
-from PyQt6.QtCore import QByteArray, QObject, Qt, QThread, QTimer, QUrl, pyqtSignal
+import threading
+from pathlib import Path
+
+from PyQt6.QtCore import (
+    QByteArray,
+    QObject,
+    QRunnable,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QAction, QDesktopServices, QKeySequence
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -33,35 +49,71 @@ from s3ui.core.s3_client import S3Client, S3ClientError
 from s3ui.core.transfers import TransferEngine
 from s3ui.ui.local_pane import LocalPaneWidget
 from s3ui.ui.s3_pane import S3PaneWidget
-from s3ui.ui.settings_dialog import SettingsDialog
 from s3ui.ui.setup_wizard import SetupWizard
 from s3ui.ui.transfer_panel import TransferPanelWidget
 
 logger = logging.getLogger("s3ui.main_window")
 
+# Translate Windows path separators to S3 key separators without allocating
+# a new string on the (common) no-backslash path.
+_WIN_SEP_TRANS = str.maketrans({"\\": "/"})
+_POSIX_SEP = os.sep == "/"
+IS_MACOS = sys.platform == "darwin"
+
+# sqlite3 keeps a per-connection cache of prepared statements keyed on the
+# SQL text; using one constant for this hot query guarantees plan reuse on
+# every transfer completion.
+_TRANSFER_DONE_SQL = (
+    "SELECT direction, object_key, total_bytes, local_path FROM transfers WHERE id = ?"
+)
 
-class _ConnectSignals(QObject):
-    connected = pyqtSignal(object, list)  # S3Client, bucket_names
-    failed = pyqtSignal(str)  # error message
+# Worker threads are deliberately not parented to the window: a QThread whose
+# C++ object is destroyed while the thread runs aborts the process, and the
+# window can be destroyed while a superseded worker is still finishing.  This
+# registry keeps each worker alive until it signals finished.
+_live_workers: set[QThread] = set()
+
+
+def _retire_worker(worker: QThread) -> None:
+    """Drop the registry reference and schedule Qt-side deletion."""
+    _live_workers.discard(worker)
+    worker.deleteLater()
+
+
+@functools.cache
+def _ks(shortcut: str) -> QKeySequence:
+    """Parse a key-sequence string once; reused across window instances."""
+    return QKeySequence(shortcut)
 
 
 class _ConnectWorker(QThread):
     """Background thread for connecting to an AWS profile and listing buckets."""
 
+    connected = pyqtSignal(object, list)  # S3Client, bucket_names
+    failed = pyqtSignal(str)  # error message
+
     def __init__(self, profile: Profile, parent=None) -> None:
         super().__init__(parent)
-        self.signals = _ConnectSignals()
         self._profile = profile
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request that the result be discarded; the thread exits on its own."""
+        self._cancel_event.set()
 
     def run(self) -> None:
         try:
             client = S3Client(self._profile)
             buckets = client.list_buckets()
-            self.signals.connected.emit(client, buckets)
+            if self._cancel_event.is_set():
+                return
+            self.connected.emit(client, buckets)
         except S3ClientError as e:
-            self.signals.failed.emit(e.user_message)
+            if not self._cancel_event.is_set():
+                self.failed.emit(e.user_message)
         except Exception as e:
-            self.signals.failed.emit(str(e))
+            if not self._cancel_event.is_set():
+                self.failed.emit(str(e))
 
 
 class _DeleteSignals(QObject):
@@ -88,20 +140,53 @@ class _DeleteWorker(QThread):
             self.signals.failed.emit(str(e))
 
 
+class _QuickOpenSignals(QObject):
+    finished = pyqtSignal(str)  # local path
+    failed = pyqtSignal(str, str)  # key, error message
+
+
+class _QuickOpenWorker(QRunnable):
+    """Downloads a small S3 object to a temp file for quick-open."""
+
+    def __init__(self, s3_client: S3Client, bucket: str, key: str, local_path: str) -> None:
+        super().__init__()
+        self.setAutoDelete(True)
+        self.signals = _QuickOpenSignals()
+        self._s3 = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._local_path = local_path
+
+    def run(self) -> None:
+        try:
+            body = self._s3.get_object(self._bucket, self._key)
+            with open(self._local_path, "wb") as f:
+                shutil.copyfileobj(body, f, length=1 << 20)
+            self.signals.finished.emit(self._local_path)
+        except Exception as e:
+            self.signals.failed.emit(self._key, str(e))
+
+
 class MainWindow(QMainWindow):
     def __init__(self, db=None) -> None:
         super().__init__()
         self._db = db
         self._transfer_engine = None
         self._tray_icon: QSystemTrayIcon | None = None
-        self._temp_files: list[str] = []
+        self._tray_checked = False
+        self._temp_files: set[str] = set()
+        self._initial_prefs: dict = {}
+        self._closing = False
         self._store = CredentialStore()
         self._s3_client: S3Client | None = None
+        self._bucket_names: list[str] = []
         self._connect_worker: _ConnectWorker | None = None
         self._wizard: SetupWizard | None = None
         self._delete_worker: _DeleteWorker | None = None
         self._cost_tracker: CostTracker | None = None
         self._aws_profile_names: set[str] = set()
+        self._bucket_id_cache: dict[tuple[str, str], int] = {}
+        self._dialog_cache: dict[str, QWidget] = {}
 
         self.setWindowTitle("S3UI")
         self.setMinimumSize(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT)
@@ -112,7 +197,6 @@ class MainWindow(QMainWindow):
         self._setup_status_bar()
         self._setup_menus()
         self._setup_keyboard_shortcuts()
-        self._setup_tray_icon()
         self._restore_state()
 
         # Wire combo signals
@@ -129,12 +213,6 @@ class MainWindow(QMainWindow):
         self._s3_pane.delete_requested.connect(self._on_delete_requested)
         self._s3_pane.new_folder_requested.connect(self._on_new_folder_requested)
 
-        # Wire transfer panel control signals
-        self._transfer_panel.pause_requested.connect(self._on_pause_transfer)
-        self._transfer_panel.resume_requested.connect(self._on_resume_transfer)
-        self._transfer_panel.cancel_requested.connect(self._on_cancel_transfer)
-        self._transfer_panel.retry_requested.connect(self._on_retry_transfer)
-
         logger.info("Main window initialized")
 
         # Discover profiles and connect after event loop starts
@@ -178,6 +256,10 @@ class MainWindow(QMainWindow):
 
     def _init_connection(self) -> None:
         """Discover profiles and connect to the last-used or first available."""
+        if self._closing:
+            # The deferred singleShot can fire after the window was closed
+            # (e.g. in tests); don't spawn workers for a dead window.
+            return
         self._populate_profiles()
 
         if self._profile_combo.count() == 0:
@@ -228,6 +310,8 @@ class MainWindow(QMainWindow):
         if not profile_name:
             return
 
+        self._bucket_id_cache.clear()
+
         if profile_name in self._aws_profile_names:
             profile = Profile(name=profile_name, is_aws_profile=True)
         else:
@@ -240,31 +324,46 @@ class MainWindow(QMainWindow):
 
     def _connect_to_profile(self, profile: Profile) -> None:
         """Create an S3 client and list buckets in a background thread."""
+        if (
+            self._connect_worker is None
+            and self._s3_client is not None
+            and self._s3_client.profile_name == profile.name
+            and self._bucket_names
+        ):
+            # Already connected to this profile — reuse the client and the
+            # bucket list instead of booting a fresh boto3 session.
+            self._on_connected(self._s3_client, self._bucket_names)
+            return
+
         if self._connect_worker is not None:
-            self._connect_worker.quit()
-            self._connect_worker.wait(1000)
+            # Don't block the UI waiting for the superseded worker — flag it
+            # cancelled and let it finish (and deleteLater) on its own.
+            self._connect_worker.cancel()
 
         self.set_status(f"Connecting to '{profile.name}'...")
         self._bucket_combo.blockSignals(True)
         self._bucket_combo.clear()
         self._bucket_combo.blockSignals(False)
 
-        self._connect_worker = _ConnectWorker(profile, self)
-        self._connect_worker.signals.connected.connect(self._on_connected)
-        self._connect_worker.signals.failed.connect(self._on_connect_failed)
-        self._connect_worker.finished.connect(self._on_connect_worker_done)
-        self._connect_worker.start()
+        worker = _ConnectWorker(profile)
+        _live_workers.add(worker)
+        worker.connected.connect(self._on_connected)
+        worker.failed.connect(self._on_connect_failed)
+        worker.finished.connect(self._on_connect_worker_done)
+        worker.finished.connect(lambda w=worker: _retire_worker(w))
+        self._connect_worker = worker
+        worker.start()
 
     def _on_connect_worker_done(self) -> None:
-        """Clean up the connect worker after it finishes."""
-        worker = self._connect_worker
-        self._connect_worker = None
-        if worker is not None:
-            worker.deleteLater()
+        """Forget a connect worker once it finishes."""
+        worker = self.sender()
+        if worker is self._connect_worker:
+            self._connect_worker = None
 
     def _on_connected(self, client: S3Client, buckets: list[str]) -> None:
         """Handle successful connection — populate bucket combo."""
         self._s3_client = client
+        self._bucket_names = buckets
         self._s3_pane.set_client(client)
 
         self._bucket_combo.blockSignals(True)
@@ -386,9 +485,14 @@ class MainWindow(QMainWindow):
 
     def _open_cost_dashboard(self) -> None:
         """Open the cost dashboard dialog."""
-        from s3ui.ui.cost_dialog import CostDialog
+        dialog = self._dialog_cache.get("cost")
+        if dialog is None:
+            from s3ui.ui.cost_dialog import CostDialog
 
-        dialog = CostDialog(cost_tracker=self._cost_tracker, parent=self)
+            dialog = CostDialog(cost_tracker=self._cost_tracker, parent=self)
+            self._dialog_cache["cost"] = dialog
+        else:
+            dialog.set_cost_tracker(self._cost_tracker)
         dialog.exec()
         self._update_cost_label()
 
@@ -412,19 +516,25 @@ class MainWindow(QMainWindow):
         if not bucket_name:
             return None
 
+        profile_name = self._profile_combo.currentData() or ""
+        cache_key = (profile_name, bucket_name)
+        bucket_id = self._bucket_id_cache.get(cache_key)
+        if bucket_id is not None:
+            return bucket_id
+
         row = self._db.fetchone(
             "SELECT id FROM buckets WHERE name = ? ORDER BY id DESC LIMIT 1",
             (bucket_name,),
         )
         if row:
-            return row["id"]
-
-        profile_name = self._profile_combo.currentData() or ""
-        cursor = self._db.execute(
-            "INSERT INTO buckets (name, region, profile) VALUES (?, ?, ?)",
-            (bucket_name, "", profile_name),
-        )
-        return cursor.lastrowid
+            bucket_id = row["id"]
+        else:
+            bucket_id = self._db.execute(
+                "INSERT INTO buckets (name, region, profile) VALUES (?, ?, ?)",
+                (bucket_name, "", profile_name),
+            ).lastrowid
+        self._bucket_id_cache[cache_key] = bucket_id
+        return bucket_id
 
     def _on_upload_requested(self, paths: list[str]) -> None:
         """Handle upload request from local pane context menu."""
@@ -436,8 +546,6 @@ class MainWindow(QMainWindow):
 
     def _enqueue_uploads(self, paths: list[str]) -> None:
         """Create transfer records and enqueue uploads."""
-        from pathlib import Path
-
         if not self._transfer_engine or not self._db:
             self.set_status("Not connected — cannot upload")
             return
@@ -448,7 +556,7 @@ class MainWindow(QMainWindow):
             return
 
         prefix = self._s3_pane.current_prefix()
-        count = 0
+        tids = []
 
         for path_str in paths:
             path = Path(path_str)
@@ -456,34 +564,32 @@ class MainWindow(QMainWindow):
                 for file_path in path.rglob("*"):
                     if file_path.is_file():
                         rel = file_path.relative_to(path.parent)
-                        key = prefix + str(rel).replace("\\", "/")
-                        self._create_upload_transfer(bucket_id, key, file_path)
-                        count += 1
+                        if _POSIX_SEP:
+                            key = prefix + rel.as_posix()
+                        else:
+                            key = prefix + str(rel).translate(_WIN_SEP_TRANS)
+                        tids.append(self._create_upload_transfer(bucket_id, key, file_path))
             elif path.is_file():
                 key = prefix + path.name
-                self._create_upload_transfer(bucket_id, key, path)
-                count += 1
+                tids.append(self._create_upload_transfer(bucket_id, key, path))
 
-        if count:
-            self.set_status(f"Uploading {count} file(s)...")
+        if tids:
+            self._ensure_transfer_panel().add_transfers(tids)
+            self._transfer_engine.enqueue_many(tids)
+            self.set_status(f"Uploading {len(tids)} file(s)...")
 
-    def _create_upload_transfer(self, bucket_id: int, key: str, local_path) -> None:
-        """Insert a single upload transfer record and enqueue it."""
+    def _create_upload_transfer(self, bucket_id: int, key: str, local_path) -> int:
+        """Insert a single upload transfer record. Returns the transfer id."""
         size = local_path.stat().st_size
-        tid = self._db.execute(
+        return self._db.execute(
             "INSERT INTO transfers "
             "(bucket_id, object_key, direction, local_path, status, total_bytes, transferred) "
             "VALUES (?, ?, 'upload', ?, 'queued', ?, 0)",
             (bucket_id, key, str(local_path), size),
         ).lastrowid
 
-        self._transfer_panel.add_transfer(tid)
-        self._transfer_engine.enqueue(tid)
-
     def _on_download_requested(self, items: list) -> None:
         """Handle download request from S3 pane context menu."""
-        from pathlib import Path
-
         if not self._transfer_engine or not self._db:
             self.set_status("Not connected — cannot download")
             return
@@ -494,12 +600,12 @@ class MainWindow(QMainWindow):
             return
 
         dest_dir = Path(self._local_pane.current_path())
-        count = 0
+        tids = []
 
         for item in items:
             if item.is_prefix:
                 continue
-            filename = item.name or item.key.rsplit("/", 1)[-1]
+            filename = item.name or item.key[item.key.rfind("/") + 1 :]
             local_path = dest_dir / filename
             size = item.size or 0
 
@@ -509,13 +615,12 @@ class MainWindow(QMainWindow):
                 "VALUES (?, ?, 'download', ?, 'queued', ?, 0)",
                 (bucket_id, item.key, str(local_path), size),
             ).lastrowid
+            tids.append(tid)
 
-            self._transfer_panel.add_transfer(tid)
-            self._transfer_engine.enqueue(tid)
-            count += 1
-
-        if count:
-            self.set_status(f"Downloading {count} file(s)...")
+        if tids:
+            self._ensure_transfer_panel().add_transfers(tids)
+            self._transfer_engine.enqueue_many(tids)
+            self.set_status(f"Downloading {len(tids)} file(s)...")
 
     def _on_delete_requested(self, items: list) -> None:
         """Handle delete request from S3 pane context menu."""
@@ -547,19 +652,18 @@ class MainWindow(QMainWindow):
         keys = [i.key for i in items]
         self.set_status(f"Deleting {len(keys)} item(s)...")
 
-        worker = _DeleteWorker(self._s3_client, bucket, keys, self)
+        worker = _DeleteWorker(self._s3_client, bucket, keys)
+        _live_workers.add(worker)
         worker.signals.finished.connect(self._on_delete_finished)
         worker.signals.failed.connect(lambda msg: self.set_status(f"Delete failed: {msg}"))
         worker.finished.connect(self._on_delete_worker_done)
+        worker.finished.connect(lambda w=worker: _retire_worker(w))
         self._delete_worker = worker
         worker.start()
 
     def _on_delete_worker_done(self) -> None:
-        """Clean up the delete worker after it finishes."""
-        worker = self._delete_worker
+        """Forget the delete worker once it finishes."""
         self._delete_worker = None
-        if worker is not None:
-            worker.deleteLater()
 
     def _on_delete_finished(self, deleted_keys: list[str]) -> None:
         """Handle completed deletion — update S3 pane and status."""
@@ -632,18 +736,42 @@ class MainWindow(QMainWindow):
         self._transfer_dock.setObjectName("TransfersDock")
         self._transfer_dock.setAllowedAreas(Qt.DockWidgetArea.BottomDockWidgetArea)
         self._transfer_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetClosable)
-        self._transfer_panel = TransferPanelWidget(db=self._db)
-        self._transfer_panel.setMinimumHeight(80)
-        self._transfer_dock.setWidget(self._transfer_panel)
+        # The panel (and its model/table) is built the first time the dock is
+        # shown or a transfer is enqueued — not at startup.
+        self._transfer_panel: TransferPanelWidget | None = None
+        self._transfer_dock.setWidget(QWidget())
+        self._transfer_dock.visibilityChanged.connect(self._on_transfer_dock_visibility)
         self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self._transfer_dock)
 
+    def _on_transfer_dock_visibility(self, visible: bool) -> None:
+        if visible:
+            self._ensure_transfer_panel()
+
+    def _ensure_transfer_panel(self) -> TransferPanelWidget:
+        """Build the transfer panel on first use."""
+        if self._transfer_panel is None:
+            panel = TransferPanelWidget(db=self._db)
+            panel.setMinimumHeight(80)
+            panel.pause_requested.connect(self._on_pause_transfer)
+            panel.resume_requested.connect(self._on_resume_transfer)
+            panel.cancel_requested.connect(self._on_cancel_transfer)
+            panel.retry_requested.connect(self._on_retry_transfer)
+            if self._transfer_engine is not None:
+                panel.set_engine(self._transfer_engine)
+            self._transfer_dock.setWidget(panel)
+            self._transfer_panel = panel
+        return self._transfer_panel
+
     @property
     def transfer_panel(self) -> TransferPanelWidget:
-        return self._transfer_panel
+        return self._ensure_transfer_panel()
 
     # --- System tray icon (for notifications) ---
 
     def _setup_tray_icon(self) -> None:
+        """Create the tray icon on first use — availability checks and icon
+        lookups are not worth paying at startup."""
+        self._tray_checked = True
         if QSystemTrayIcon.isSystemTrayAvailable():
             self._tray_icon = QSystemTrayIcon(self)
             self._tray_icon.setIcon(self.windowIcon())
@@ -654,6 +782,8 @@ class MainWindow(QMainWindow):
 
     def _notify(self, title: str, message: str) -> None:
         """Show a system notification if the app is not in the foreground."""
+        if not self._tray_checked:
+            self._setup_tray_icon()
         if self._tray_icon is None:
             return
         if self.isActiveWindow():
@@ -667,7 +797,8 @@ class MainWindow(QMainWindow):
     def set_transfer_engine(self, engine) -> None:
         """Wire a TransferEngine to the panel and optimistic update signals."""
         self._transfer_engine = engine
-        self._transfer_panel.set_engine(engine)
+        if self._transfer_panel is not None:
+            self._transfer_panel.set_engine(engine)
 
         # Wire transfer completion → optimistic S3 pane updates + notifications
         engine.transfer_finished.connect(self._on_transfer_finished)
@@ -677,7 +808,7 @@ class MainWindow(QMainWindow):
         if self._db is None:
             return
 
-        row = self._db.fetchone("SELECT * FROM transfers WHERE id = ?", (transfer_id,))
+        row = self._db.fetchone(_TRANSFER_DONE_SQL, (transfer_id,))
         if not row:
             return
 
@@ -693,8 +824,6 @@ class MainWindow(QMainWindow):
         total = row["total_bytes"] or 0
         if total >= NOTIFY_SIZE_THRESHOLD:
             direction = "Upload" if row["direction"] == "upload" else "Download"
-            from pathlib import Path
-
             filename = Path(row["local_path"]).name
             self._notify(f"{direction} complete", filename)
 
@@ -711,20 +840,25 @@ class MainWindow(QMainWindow):
             self._s3_pane.download_requested.emit([item])
             return
 
-        # Small file — download inline to temp dir
+        # Small file — download to temp dir off the GUI thread
         TEMP_DIR.mkdir(parents=True, exist_ok=True)
-        filename = item.name or item.key.rsplit("/", 1)[-1]
+        filename = item.name or item.key[item.key.rfind("/") + 1 :]
         local_path = TEMP_DIR / filename
 
-        try:
-            body = self._s3_pane._s3_client.get_object(self._s3_pane._bucket, item.key)
-            data = body.read()
-            local_path.write_bytes(data)
-            self._temp_files.append(str(local_path))
-            QDesktopServices.openUrl(QUrl.fromLocalFile(str(local_path)))
-        except Exception as e:
-            logger.warning("Quick-open failed for %s: %s", item.key, e)
-            self.set_status(f"Failed to open: {e}")
+        worker = _QuickOpenWorker(
+            self._s3_pane._s3_client, self._s3_pane._bucket, item.key, str(local_path)
+        )
+        worker.signals.finished.connect(self._on_quick_open_done)
+        worker.signals.failed.connect(self._on_quick_open_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_quick_open_done(self, local_path: str) -> None:
+        self._temp_files.add(local_path)
+        QDesktopServices.openUrl(QUrl.fromLocalFile(local_path))
+
+    def _on_quick_open_failed(self, key: str, error: str) -> None:
+        logger.warning("Quick-open failed for %s: %s", key, error)
+        self.set_status(f"Failed to open: {error}")
 
     # --- Status bar ---
 
@@ -740,8 +874,26 @@ class MainWindow(QMainWindow):
         sb.addPermanentWidget(self._total_size_label)
         sb.addPermanentWidget(self._cost_label)
 
+        # Coalesce bursty status updates to ~60 Hz to limit repaints.
+        self._pending_status: str | None = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+
     def set_status(self, text: str) -> None:
+        if self._status_timer.isActive():
+            # A recent update is still within the coalescing window — hold
+            # the latest text and apply it when the timer fires.
+            self._pending_status = text
+            return
         self._status_label.setText(text)
+        self._status_timer.start()
+
+    def _flush_status(self) -> None:
+        if self._pending_status is not None:
+            self._status_label.setText(self._pending_status)
+            self._pending_status = None
 
     @property
     def s3_pane(self) -> S3PaneWidget:
@@ -761,7 +913,14 @@ class MainWindow(QMainWindow):
 
     def _open_settings(self) -> None:
         current_profile = self._profile_combo.currentData()
-        dialog = SettingsDialog(store=self._store, db=self._db, parent=self)
+        dialog = self._dialog_cache.get("settings")
+        if dialog is None:
+            from s3ui.ui.settings_dialog import SettingsDialog
+
+            dialog = SettingsDialog(store=self._store, db=self._db, parent=self)
+            self._dialog_cache["settings"] = dialog
+        else:
+            dialog.reset_last_added_profile()
         dialog.exec()
         # Refresh profile list in case credentials were added/removed
         self._populate_profiles()
@@ -782,12 +941,12 @@ class MainWindow(QMainWindow):
     def _setup_keyboard_shortcuts(self) -> None:
         # Focus switching: Ctrl+1 → local pane, Ctrl+2 → S3 pane
         focus_local = QAction("Focus Local Pane", self)
-        focus_local.setShortcut(QKeySequence("Ctrl+1"))
+        focus_local.setShortcut(_ks("Ctrl+1"))
         focus_local.triggered.connect(self._focus_local_pane)
         self.addAction(focus_local)
 
         focus_s3 = QAction("Focus S3 Pane", self)
-        focus_s3.setShortcut(QKeySequence("Ctrl+2"))
+        focus_s3.setShortcut(_ks("Ctrl+2"))
         focus_s3.triggered.connect(self._focus_s3_pane)
         self.addAction(focus_s3)
 
@@ -804,48 +963,76 @@ class MainWindow(QMainWindow):
         if self._db is None:
             return
 
-        from s3ui.db.database import set_pref
-
-        set_pref(self._db, "window_geometry", self.saveGeometry().toBase64().data().decode())
-        set_pref(self._db, "window_state", self.saveState().toBase64().data().decode())
-        set_pref(self._db, "splitter_state", self._splitter.saveState().toBase64().data().decode())
-        set_pref(
-            self._db,
-            "transfer_dock_visible",
-            "true" if self._transfer_dock.isVisible() else "false",
-        )
-        set_pref(self._db, "local_pane_path", self._local_pane.current_path())
+        from s3ui.db.database import set_prefs
+
+        prefs = {
+            "window_geometry": self.saveGeometry().data(),
+            "window_state": self.saveState().data(),
+            "splitter_state": self._splitter.saveState().data(),
+            "transfer_dock_visible": "true" if self._transfer_dock.isVisible() else "false",
+            "local_pane_path": self._local_pane.current_path(),
+            # The pane is showing this directory, so it was a valid dir
+            # this session — lets the next startup skip the stat().
+            "local_pane_path_checked": self._local_pane.current_path(),
+        }
+        # Only write keys that actually changed since startup.
+        dirty = {k: v for k, v in prefs.items() if self._initial_prefs.get(k) != v}
+        if dirty:
+            set_prefs(self._db, dirty)
+            self._initial_prefs.update(dirty)
 
     def _restore_state(self) -> None:
         """Restore window geometry, splitter position, and dock state."""
         if self._db is None:
             return
 
-        from s3ui.db.database import get_bool_pref, get_pref
+        from s3ui.db.database import blob_value, get_prefs
+
+        prefs = get_prefs(
+            self._db,
+            [
+                "window_geometry",
+                "window_state",
+                "splitter_state",
+                "transfer_dock_visible",
+                "local_pane_path",
+                "local_pane_path_checked",
+            ],
+        )
+
+        # Remember what was loaded so _save_state can skip unchanged keys.
+        self._initial_prefs = dict(prefs)
 
-        geom = get_pref(self._db, "window_geometry")
+        geom = blob_value(prefs.get("window_geometry"))
         if geom:
-            self.restoreGeometry(QByteArray.fromBase64(geom.encode()))
+            self.restoreGeometry(QByteArray(geom))
 
-        state = get_pref(self._db, "window_state")
+        state = blob_value(prefs.get("window_state"))
         if state:
-            self.restoreState(QByteArray.fromBase64(state.encode()))
+            self.restoreState(QByteArray(state))
 
-        splitter = get_pref(self._db, "splitter_state")
+        splitter = blob_value(prefs.get("splitter_state"))
         if splitter:
-            self._splitter.restoreState(QByteArray.fromBase64(splitter.encode()))
+            self._splitter.restoreState(QByteArray(splitter))
 
-        dock_vis = get_bool_pref(self._db, "transfer_dock_visible", default=True)
+        dock_vis = prefs.get("transfer_dock_visible", "true").lower() in ("true", "1", "yes")
         self._transfer_dock.setVisible(dock_vis)
 
-        local_path = get_pref(self._db, "local_pane_path")
-        if local_path:
-            from pathlib import Path
-
-            if Path(local_path).is_dir():
-                self._local_pane.navigate_to(local_path, record_history=False)
+        local_path = prefs.get("local_pane_path")
+        # Skip the stat() when the path was already validated last session;
+        # navigate_to re-checks is_dir() anyway if the dir has vanished.
+        if local_path and (
+            local_path == prefs.get("local_pane_path_checked") or Path(local_path).is_dir()
+        ):
+            self._local_pane.navigate_to(local_path, record_history=False)
 
     def closeEvent(self, event) -> None:
+        self._closing = True
+        if self._connect_worker is not None:
+            self._connect_worker.cancel()
+        # Child widgets never get a close event of their own; drain the S3
+        # pane's fetch pool before the C++ teardown can deadlock on it
+        self._s3_pane.close()
         self._save_state()
         self._cleanup_temp_files()
         if self._tray_icon:
@@ -854,12 +1041,9 @@ class MainWindow(QMainWindow):
 
     def _cleanup_temp_files(self) -> None:
         """Remove any temp files downloaded for quick-open."""
-        import contextlib
-        from pathlib import Path
-
         for path_str in self._temp_files:
             with contextlib.suppress(OSError):
-                Path(path_str).unlink()
+                os.unlink(path_str)
         self._temp_files.clear()
 
     # --- Show Log File ---
@@ -871,106 +1055,152 @@ class MainWindow(QMainWindow):
     # --- Menus ---
 
     def _setup_menus(self) -> None:
-        menu_bar = self.menuBar()
+        """Build the menu bar from a declarative spec.
+
+        Each entry is (attr_name, text, options): attr_name of None means the
+        action is not kept on self, and a bare None inserts a separator.
+        """
+        menus: list[tuple[str, list]] = [
+            (
+                "&File",
+                [
+                    (
+                        None,
+                        "&Settings...",
+                        {
+                            "slot": self._open_settings,
+                            "shortcut": _ks("Ctrl+,") if IS_MACOS else None,
+                            "role": QAction.MenuRole.PreferencesRole if IS_MACOS else None,
+                        },
+                    ),
+                    (None, "Setup &Wizard...", {"slot": self._show_setup_wizard}),
+                    None,
+                    (
+                        None,
+                        "&Quit",
+                        {
+                            "slot": self.close,
+                            "shortcut": QKeySequence.StandardKey.Quit,
+                            "role": QAction.MenuRole.QuitRole if IS_MACOS else None,
+                        },
+                    ),
+                ],
+            ),
+            (
+                "&Edit",
+                [
+                    (
+                        "_copy_action",
+                        "&Copy",
+                        {"shortcut": QKeySequence.StandardKey.Copy, "enabled": False},
+                    ),
+                    (
+                        "_paste_action",
+                        "&Paste",
+                        {"shortcut": QKeySequence.StandardKey.Paste, "enabled": False},
+                    ),
+                    None,
+                    (
+                        "_delete_action",
+                        "&Delete",
+                        {"shortcut": QKeySequence.StandardKey.Delete, "enabled": False},
+                    ),
+                    ("_rename_action", "&Rename", {"enabled": False}),
+                ],
+            ),
+            (
+                "&View",
+                [
+                    (
+                        "_hidden_files_action",
+                        "Show &Hidden Files",
+                        {
+                            "checkable": True,
+                            "toggled": self._local_pane.set_show_hidden,
+                        },
+                    ),
+                    (
+                        "_toggle_transfers_action",
+                        "Show &Transfers",
+                        {
+                            "checkable": True,
+                            "checked": True,
+                            "toggled": self._transfer_dock.setVisible,
+                        },
+                    ),
+                ],
+            ),
+            (
+                "&Go",
+                [
+                    (
+                        None,
+                        "&Back",
+                        {"slot": self._local_pane.go_back, "shortcut": _ks("Alt+Left")},
+                    ),
+                    (
+                        None,
+                        "&Forward",
+                        {
+                            "slot": self._local_pane.go_forward,
+                            "shortcut": _ks("Alt+Right"),
+                        },
+                    ),
+                    (
+                        None,
+                        "Enclosing &Folder",
+                        {"slot": self._local_pane.go_up, "shortcut": _ks("Alt+Up")},
+                    ),
+                ],
+            ),
+            (
+                "&Bucket",
+                [
+                    (
+                        "_refresh_action",
+                        "&Refresh",
+                        {"slot": self._s3_pane.refresh, "shortcut": _ks("Ctrl+R")},
+                    ),
+                    None,
+                    ("_stats_action", "Bucket &Stats...", {"enabled": False}),
+                    (
+                        "_cost_action",
+                        "&Cost Dashboard...",
+                        {"slot": self._open_cost_dashboard, "enabled": False},
+                    ),
+                ],
+            ),
+            (
+                "&Help",
+                [
+                    ("_show_log_action", "Show &Log File", {"slot": self._open_log_directory}),
+                ],
+            ),
+        ]
 
-        # File menu
-        file_menu = menu_bar.addMenu("&File")
-
-        settings_action = QAction("&Settings...", self)
-        settings_action.triggered.connect(self._open_settings)
-        if sys.platform == "darwin":
-            settings_action.setShortcut(QKeySequence("Ctrl+,"))
-            settings_action.setMenuRole(QAction.MenuRole.PreferencesRole)
-        file_menu.addAction(settings_action)
-
-        wizard_action = QAction("Setup &Wizard...", self)
-        wizard_action.triggered.connect(self._show_setup_wizard)
-        file_menu.addAction(wizard_action)
-
-        file_menu.addSeparator()
-
-        quit_action = QAction("&Quit", self)
-        quit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        quit_action.triggered.connect(self.close)
-        if sys.platform == "darwin":
-            quit_action.setMenuRole(QAction.MenuRole.QuitRole)
-        file_menu.addAction(quit_action)
-
-        # Edit menu
-        edit_menu = menu_bar.addMenu("&Edit")
-        self._copy_action = QAction("&Copy", self)
-        self._copy_action.setShortcut(QKeySequence.StandardKey.Copy)
-        self._copy_action.setEnabled(False)
-        edit_menu.addAction(self._copy_action)
-
-        self._paste_action = QAction("&Paste", self)
-        self._paste_action.setShortcut(QKeySequence.StandardKey.Paste)
-        self._paste_action.setEnabled(False)
-        edit_menu.addAction(self._paste_action)
-
-        edit_menu.addSeparator()
-
-        self._delete_action = QAction("&Delete", self)
-        self._delete_action.setShortcut(QKeySequence.StandardKey.Delete)
-        self._delete_action.setEnabled(False)
-        edit_menu.addAction(self._delete_action)
-
-        self._rename_action = QAction("&Rename", self)
-        self._rename_action.setEnabled(False)
-        edit_menu.addAction(self._rename_action)
-
-        # View menu
-        view_menu = menu_bar.addMenu("&View")
-        self._hidden_files_action = QAction("Show &Hidden Files", self)
-        self._hidden_files_action.setCheckable(True)
-        self._hidden_files_action.toggled.connect(
-            lambda checked: self._local_pane.set_show_hidden(checked)
-        )
-        view_menu.addAction(self._hidden_files_action)
-
-        self._toggle_transfers_action = QAction("Show &Transfers", self)
-        self._toggle_transfers_action.setCheckable(True)
-        self._toggle_transfers_action.setChecked(True)
-        self._toggle_transfers_action.toggled.connect(self._transfer_dock.setVisible)
-        view_menu.addAction(self._toggle_transfers_action)
-
-        # Go menu
-        go_menu = menu_bar.addMenu("&Go")
-        back_action = QAction("&Back", self)
-        back_action.setShortcut(QKeySequence("Alt+Left"))
-        back_action.triggered.connect(self._local_pane.go_back)
-        go_menu.addAction(back_action)
-
-        forward_action = QAction("&Forward", self)
-        forward_action.setShortcut(QKeySequence("Alt+Right"))
-        forward_action.triggered.connect(self._local_pane.go_forward)
-        go_menu.addAction(forward_action)
-
-        up_action = QAction("Enclosing &Folder", self)
-        up_action.setShortcut(QKeySequence("Alt+Up"))
-        up_action.triggered.connect(self._local_pane.go_up)
-        go_menu.addAction(up_action)
-
-        # Bucket menu
-        bucket_menu = menu_bar.addMenu("&Bucket")
-        self._refresh_action = QAction("&Refresh", self)
-        self._refresh_action.setShortcut(QKeySequence("Ctrl+R"))
-        self._refresh_action.triggered.connect(self._s3_pane.refresh)
-        bucket_menu.addAction(self._refresh_action)
-
-        bucket_menu.addSeparator()
-
-        self._stats_action = QAction("Bucket &Stats...", self)
-        self._stats_action.setEnabled(False)
-        bucket_menu.addAction(self._stats_action)
-
-        self._cost_action = QAction("&Cost Dashboard...", self)
-        self._cost_action.setEnabled(False)
-        self._cost_action.triggered.connect(self._open_cost_dashboard)
-        bucket_menu.addAction(self._cost_action)
-
-        # Help menu
-        help_menu = menu_bar.addMenu("&Help")
-        self._show_log_action = QAction("Show &Log File", self)
-        self._show_log_action.triggered.connect(self._open_log_directory)
-        help_menu.addAction(self._show_log_action)
+        menu_bar = self.menuBar()
+        for menu_title, entries in menus:
+            menu = menu_bar.addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                attr_name, text, opts = entry
+                action = QAction(text, self)
+                if opts.get("shortcut") is not None:
+                    action.setShortcut(opts["shortcut"])
+                if opts.get("role") is not None:
+                    action.setMenuRole(opts["role"])
+                if opts.get("checkable"):
+                    action.setCheckable(True)
+                if opts.get("checked"):
+                    action.setChecked(True)
+                if not opts.get("enabled", True):
+                    action.setEnabled(False)
+                if opts.get("slot") is not None:
+                    action.triggered.connect(opts["slot"])
+                if opts.get("toggled") is not None:
+                    action.toggled.connect(opts["toggled"])
+                if attr_name:
+                    setattr(self, attr_name, action)
+                menu.addAction(action)
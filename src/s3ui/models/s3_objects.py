@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import bisect
 import logging
-from dataclasses import dataclass
+import operator
+import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
@@ -13,7 +15,7 @@ from PyQt6.QtWidgets import QFileIconProvider
 logger = logging.getLogger("s3ui.s3_objects")
 
 
-@dataclass
+@dataclass(slots=True)
 class S3Item:
     """Represents a single S3 object or prefix (folder) in a listing."""
 
@@ -24,11 +26,42 @@ class S3Item:
     last_modified: datetime | None = None
     storage_class: str | None = None
     etag: str | None = None
+    # Sort tuple (prefixes first, then lowercased name), precomputed so
+    # sorting doesn't build a tuple or call str.lower() per comparison.
+    _sort_tuple: tuple[int, str] = field(init=False, repr=False, compare=False)
+    # Formatted-cell caches; data() is re-called per visible cell on every
+    # repaint, so the format work is done once per mutation instead.
+    _size_str: str | None = field(init=False, repr=False, compare=False, default=None)
+    _date_str: str | None = field(init=False, repr=False, compare=False, default=None)
+    _date_is_relative: bool = field(init=False, repr=False, compare=False, default=False)
+    _date_computed_at: float = field(init=False, repr=False, compare=False, default=0.0)
 
+    def __post_init__(self) -> None:
+        self._sort_tuple = (0 if self.is_prefix else 1, self.name.lower())
 
-def _sort_key(item: S3Item) -> tuple[int, str]:
-    """Sort key: prefixes first (0), then objects (1), alphabetical by name."""
-    return (0 if item.is_prefix else 1, item.name.lower())
+
+# Sort key: prefixes first (0), then objects (1), alphabetical by name.
+# attrgetter is C-implemented, so key extraction skips a Python frame per item.
+_sort_key = operator.attrgetter("_sort_tuple")
+
+
+def _ensure_sorted(items: list[S3Item]) -> list[S3Item]:
+    """Return ``items`` in sort order, skipping the sort when already ordered.
+
+    Revalidation feeds in paginated listings that usually arrive pre-sorted,
+    so a single O(n) scan commonly replaces the O(n log n) sort.
+    """
+    prev = None
+    for item in items:
+        if prev is not None and item._sort_tuple < prev:
+            return sorted(items, key=_sort_key)
+        prev = item._sort_tuple
+    return items
+
+
+# Divisor/suffix pairs indexed by bit length: each power of 1024 adds ten
+# bits, so the unit falls out of integer math instead of a comparison chain.
+_SIZE_UNITS = ((1, "B"), (1024, "KB"), (1024 * 1024, "MB"), (1024**3, "GB"))
 
 
 def _format_size(size_bytes: int | None) -> str:
@@ -37,33 +70,45 @@ def _format_size(size_bytes: int | None) -> str:
         return ""
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024**3):.1f} GB"
+    divisor, suffix = _SIZE_UNITS[min((size_bytes.bit_length() - 1) // 10, 3)]
+    return f"{size_bytes / divisor:.1f} {suffix}"
+
+
+# datetime.now(UTC) is surprisingly costly when a paint burst formats
+# hundreds of dates; one-second resolution is plenty for display purposes.
+_cached_now: datetime | None = None
+_cached_now_mono: float = 0.0
+
+
+def _utc_now() -> datetime:
+    global _cached_now, _cached_now_mono
+    mono = time.monotonic()
+    if _cached_now is None or mono - _cached_now_mono >= 1.0:
+        _cached_now = datetime.now(UTC)
+        _cached_now_mono = mono
+    return _cached_now
 
 
 def _format_date(dt: datetime | None) -> str:
     """Format datetime into human-readable string."""
     if dt is None:
         return ""
-    now = datetime.now(UTC)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=UTC)
-    delta = now - dt
-    if delta.total_seconds() < 0:
+    # time.time() gives an exact age without constructing a datetime; the
+    # cached now() is only consulted for the year comparison below.
+    seconds = time.time() - dt.timestamp()
+    if seconds < 0:
         return dt.strftime("%b %d, %Y")
-    if delta.total_seconds() < 60:
+    if seconds < 60:
         return "Just now"
-    if delta.total_seconds() < 3600:
-        mins = int(delta.total_seconds() / 60)
+    if seconds < 3600:
+        mins = int(seconds / 60)
         return f"{mins} minute{'s' if mins != 1 else ''} ago"
-    if delta.total_seconds() < 86400:
-        hours = int(delta.total_seconds() / 3600)
+    if seconds < 86400:
+        hours = int(seconds / 3600)
         return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    if dt.year == now.year:
+    if dt.year == _utc_now().year:
         return dt.strftime("%b %d")
     return dt.strftime("%b %d, %Y")
 
@@ -83,7 +128,26 @@ class S3ObjectModel(QAbstractTableModel):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._items: list[S3Item] = []
-        self._icon_provider = QFileIconProvider()
+        # Parallel list of _sort_key results, maintained across mutations so
+        # inserts bisect precomputed keys instead of rescanning every item.
+        self._sort_keys: list[tuple[int, str]] = []
+        # Key -> row index, maintained across mutations so removes and
+        # updates don't scan the item list.
+        self._key_to_row: dict[str, int] = {}
+        # Running sum of object sizes, maintained across mutations so
+        # total_size() stays O(1) for the footer.
+        self._total_size = 0
+        # Resolve the two icons once; the provider hits the platform theme
+        # on every lookup and data() is called per visible cell per repaint.
+        provider = QFileIconProvider()
+        self._folder_icon = provider.icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = provider.icon(QFileIconProvider.IconType.File)
+
+    def _reindex_from(self, start: int) -> None:
+        """Refresh _key_to_row for rows at or after ``start``."""
+        items = self._items
+        for row in range(start, len(items)):
+            self._key_to_row[items[row].key] = row
 
     # --- Qt model interface ---
 
@@ -112,15 +176,27 @@ class S3ObjectModel(QAbstractTableModel):
             elif col == COL_SIZE:
                 if item.is_prefix:
                     return ""
-                return _format_size(item.size)
+                text = item._size_str
+                if text is None:
+                    text = item._size_str = _format_size(item.size)
+                return text
             elif col == COL_MODIFIED:
-                return _format_date(item.last_modified)
+                text = item._date_str
+                if text is None or (
+                    # Relative strings ("5 minutes ago") drift; refresh them
+                    # once a minute instead of reformatting every repaint.
+                    item._date_is_relative
+                    and time.monotonic() - item._date_computed_at > 60.0
+                ):
+                    text = _format_date(item.last_modified)
+                    item._date_str = text
+                    item._date_is_relative = text == "Just now" or text.endswith(" ago")
+                    item._date_computed_at = time.monotonic()
+                return text
             return None
 
         if role == Qt.ItemDataRole.DecorationRole and col == COL_NAME:
-            if item.is_prefix:
-                return self._icon_provider.icon(QFileIconProvider.IconType.Folder)
-            return self._icon_provider.icon(QFileIconProvider.IconType.File)
+            return self._folder_icon if item.is_prefix else self._file_icon
 
         if role == Qt.ItemDataRole.TextAlignmentRole:
             if col == COL_SIZE:
@@ -159,7 +235,7 @@ class S3ObjectModel(QAbstractTableModel):
 
     def total_size(self) -> int:
         """Sum of all item sizes."""
-        return sum(item.size or 0 for item in self._items if not item.is_prefix)
+        return self._total_size
 
     def item_count(self) -> int:
         return len(self._items)
@@ -174,6 +250,9 @@ class S3ObjectModel(QAbstractTableModel):
         """Replace all items. Only for initial load."""
         self.beginResetModel()
         self._items = sorted(items, key=_sort_key)
+        self._sort_keys = [_sort_key(i) for i in self._items]
+        self._key_to_row = {item.key: row for row, item in enumerate(self._items)}
+        self._total_size = sum(item.size or 0 for item in self._items if not item.is_prefix)
         self.endResetModel()
 
     def clear(self) -> None:
@@ -182,6 +261,9 @@ class S3ObjectModel(QAbstractTableModel):
             return
         self.beginResetModel()
         self._items.clear()
+        self._sort_keys.clear()
+        self._key_to_row.clear()
+        self._total_size = 0
         self.endResetModel()
 
     # --- Granular mutation methods ---
@@ -189,50 +271,120 @@ class S3ObjectModel(QAbstractTableModel):
     def insert_item(self, item: S3Item) -> int:
         """Insert item in sorted position. Returns the row index."""
         key = _sort_key(item)
-        keys = [_sort_key(i) for i in self._items]
-        row = bisect.bisect_left(keys, key)
+        row = bisect.bisect_left(self._sort_keys, key)
         self.beginInsertRows(QModelIndex(), row, row)
         self._items.insert(row, item)
+        self._sort_keys.insert(row, key)
+        self._reindex_from(row)
+        if not item.is_prefix:
+            self._total_size += item.size or 0
         self.endInsertRows()
         return row
 
     def remove_item(self, key: str) -> bool:
         """Remove item by key. Returns True if found."""
-        for row, item in enumerate(self._items):
-            if item.key == key:
-                self.beginRemoveRows(QModelIndex(), row, row)
-                self._items.pop(row)
-                self.endRemoveRows()
-                return True
-        return False
+        row = self._key_to_row.pop(key, None)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        item = self._items.pop(row)
+        self._sort_keys.pop(row)
+        self._reindex_from(row)
+        if not item.is_prefix:
+            self._total_size -= item.size or 0
+        self.endRemoveRows()
+        return True
 
     def remove_items(self, keys: set[str]) -> int:
         """Batch remove items by keys. Removes highest index first. Returns count removed."""
-        rows_to_remove = []
-        for row, item in enumerate(self._items):
-            if item.key in keys:
-                rows_to_remove.append(row)
+        rows_to_remove = sorted(
+            row for key in keys if (row := self._key_to_row.get(key)) is not None
+        )
         if not rows_to_remove:
             return 0
-        # Remove from highest index first to avoid shifting
-        for row in reversed(rows_to_remove):
-            self.beginRemoveRows(QModelIndex(), row, row)
-            self._items.pop(row)
+        for row in rows_to_remove:
+            item = self._items[row]
+            if not item.is_prefix:
+                self._total_size -= item.size or 0
+        # Coalesce contiguous rows so each range costs one remove signal,
+        # and remove from highest range first to avoid shifting.
+        ranges: list[tuple[int, int]] = []
+        start = prev = rows_to_remove[0]
+        for row in rows_to_remove[1:]:
+            if row == prev + 1:
+                prev = row
+            else:
+                ranges.append((start, prev))
+                start = prev = row
+        ranges.append((start, prev))
+        for first, last in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._items[first : last + 1]
+            del self._sort_keys[first : last + 1]
             self.endRemoveRows()
+        # One rebuild beats per-row shifting for a batch
+        self._key_to_row = {item.key: row for row, item in enumerate(self._items)}
         return len(rows_to_remove)
 
+    def insert_items(self, items: list[S3Item]) -> None:
+        """Batch insert in sorted position, one insert signal per run.
+
+        Adds that land at the same insertion point are spliced together so
+        the view relayouts O(runs) times instead of O(adds).
+        """
+        if not items:
+            return
+        new_sorted = _ensure_sorted(items)
+
+        # Compute insertion points against the unmodified key list, grouping
+        # consecutive adds that share a point into one run.
+        runs: list[tuple[int, list[S3Item], list[tuple[int, str]]]] = []
+        for item in new_sorted:
+            key = _sort_key(item)
+            pos = bisect.bisect_left(self._sort_keys, key)
+            if runs and runs[-1][0] == pos:
+                runs[-1][1].append(item)
+                runs[-1][2].append(key)
+            else:
+                runs.append((pos, [item], [key]))
+
+        offset = 0
+        for pos, run_items, run_keys in runs:
+            first = pos + offset
+            self.beginInsertRows(QModelIndex(), first, first + len(run_items) - 1)
+            self._items[first:first] = run_items
+            self._sort_keys[first:first] = run_keys
+            self.endInsertRows()
+            offset += len(run_items)
+        self._reindex_from(runs[0][0])
+        self._total_size += sum(item.size or 0 for item in new_sorted if not item.is_prefix)
+
     def update_item(self, item_key: str, **fields) -> bool:
         """Update fields on an existing item. Emits dataChanged for that row only."""
-        for row, item in enumerate(self._items):
-            if item.key == item_key:
-                for field, value in fields.items():
-                    if hasattr(item, field):
-                        setattr(item, field, value)
-                top_left = self.index(row, 0)
-                bottom_right = self.index(row, _COLUMN_COUNT - 1)
-                self.dataChanged.emit(top_left, bottom_right)
-                return True
-        return False
+        row = self._key_to_row.get(item_key)
+        if row is None:
+            return False
+        item = self._items[row]
+        if "size" in fields and not item.is_prefix:
+            self._total_size += (fields["size"] or 0) - (item.size or 0)
+        for name, value in fields.items():
+            if hasattr(item, name):
+                setattr(item, name, value)
+        if "key" in fields:
+            # Re-key the row index, or later lookups (delete-after-rename)
+            # still resolve the old key
+            del self._key_to_row[item_key]
+            self._key_to_row[item.key] = row
+        if "name" in fields:
+            item._sort_tuple = (0 if item.is_prefix else 1, item.name.lower())
+        if "size" in fields:
+            item._size_str = None
+        if "last_modified" in fields:
+            item._date_str = None
+        top_left = self.index(row, 0)
+        bottom_right = self.index(row, _COLUMN_COUNT - 1)
+        self.dataChanged.emit(top_left, bottom_right)
+        return True
 
     def append_items(self, items: list[S3Item]) -> None:
         """Append items at end (for incremental page loading)."""
@@ -242,6 +394,9 @@ class S3ObjectModel(QAbstractTableModel):
         end = start + len(items) - 1
         self.beginInsertRows(QModelIndex(), start, end)
         self._items.extend(items)
+        self._sort_keys.extend(_sort_key(i) for i in items)
+        self._reindex_from(start)
+        self._total_size += sum(item.size or 0 for item in items if not item.is_prefix)
         self.endInsertRows()
 
     def diff_apply(self, new_items: list[S3Item]) -> bool:
@@ -250,7 +405,7 @@ class S3ObjectModel(QAbstractTableModel):
         Returns True if any changes were made.
         Used by background revalidation to minimize UI disruption.
         """
-        new_sorted = sorted(new_items, key=_sort_key)
+        new_sorted = _ensure_sorted(new_items)
         old_by_key = {item.key: item for item in self._items}
         new_by_key = {item.key: item for item in new_sorted}
 
@@ -287,9 +442,9 @@ class S3ObjectModel(QAbstractTableModel):
                 self.update_item(key, **updates)
                 changed = True
 
-        # Insert new items
-        for key in added_keys:
-            self.insert_item(new_by_key[key])
+        # Insert new items in coalesced runs
+        if added_keys:
+            self.insert_items([new_by_key[key] for key in added_keys])
             changed = True
 
         return changed
@@ -0,0 +1,172 @@
+"""Flat directory model backed by os.scandir — opt-in for huge directories."""
+
+from __future__ import annotations
+
+import logging
+import os
+from array import array
+from datetime import datetime
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from s3ui.models.s3_objects import _format_size
+
+logger = logging.getLogger("s3ui.scandir_model")
+
+COL_NAME = 0
+COL_SIZE = 1
+COL_MODIFIED = 2
+
+COLUMN_HEADERS = ["Name", "Size", "Date Modified"]
+
+
+class ScanDirModel(QAbstractItemModel):
+    """Opt-in replacement for QFileSystemModel on very large directories.
+
+    One os.scandir pass lists the directory, and entries are stored
+    struct-of-arrays style — parallel arrays of names, sizes, mtimes and
+    dir flags — instead of a QFileInfo object per row. Sorting computes an
+    integer permutation over the relevant array in one pass, and data()
+    reads straight out of the arrays for the rows actually on screen.
+    """
+
+    _EMPTY_INDEX = QModelIndex()
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._path = ""
+        self._show_hidden = False
+        self._names: list[str] = []
+        self._sizes = array("q")
+        self._mtimes = array("q")
+        self._is_dir = array("b")
+        self._order: list[int] = []  # view row -> entry index permutation
+        self._sort_column = COL_NAME
+        self._sort_desc = False
+
+    def set_directory(self, path: str) -> None:
+        """List ``path`` and replace the model contents."""
+        self.beginResetModel()
+        self._path = path
+        names: list[str] = []
+        sizes = array("q")
+        mtimes = array("q")
+        is_dir = array("b")
+        show_hidden = self._show_hidden
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if not show_hidden and entry.name.startswith("."):
+                        continue
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                        directory = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    names.append(entry.name)
+                    sizes.append(st.st_size)
+                    mtimes.append(int(st.st_mtime))
+                    is_dir.append(1 if directory else 0)
+        except OSError as exc:
+            logger.warning("Cannot list %s: %s", path, exc)
+        self._names = names
+        self._sizes = sizes
+        self._mtimes = mtimes
+        self._is_dir = is_dir
+        self._apply_sort()
+        self.endResetModel()
+
+    def set_show_hidden(self, show: bool) -> None:
+        if show != self._show_hidden:
+            self._show_hidden = show
+            if self._path:
+                self.set_directory(self._path)
+
+    def directory(self) -> str:
+        return self._path
+
+    # QFileSystemModel-compatible accessors so call sites need not care
+    # which backend is installed on the view.
+
+    def filePath(self, index: QModelIndex) -> str:
+        if not index.isValid():
+            return ""
+        return os.path.join(self._path, self._names[self._order[index.row()]])
+
+    def isDir(self, index: QModelIndex) -> bool:
+        if not index.isValid():
+            return False
+        return bool(self._is_dir[self._order[index.row()]])
+
+    # --- QAbstractItemModel interface ---
+
+    def index(self, row: int, column: int, parent: QModelIndex = _EMPTY_INDEX) -> QModelIndex:
+        if parent.isValid():
+            return QModelIndex()
+        if not (0 <= row < len(self._order) and 0 <= column < len(COLUMN_HEADERS)):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex) -> QModelIndex:  # flat model
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = _EMPTY_INDEX) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._order)
+
+    def columnCount(self, parent: QModelIndex = _EMPTY_INDEX) -> int:
+        if parent.isValid():
+            return 0
+        return len(COLUMN_HEADERS)
+
+    def hasChildren(self, parent: QModelIndex = _EMPTY_INDEX) -> bool:
+        return not parent.isValid()
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(COLUMN_HEADERS)
+        ):
+            return COLUMN_HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        i = self._order[index.row()]
+        col = index.column()
+        if col == COL_NAME:
+            return self._names[i]
+        if col == COL_SIZE:
+            if self._is_dir[i]:
+                return ""
+            return _format_size(self._sizes[i])
+        if col == COL_MODIFIED:
+            return datetime.fromtimestamp(self._mtimes[i]).strftime("%Y-%m-%d %H:%M")
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self._sort_column = column
+        self._sort_desc = order == Qt.SortOrder.DescendingOrder
+        self.layoutAboutToBeChanged.emit()
+        self._apply_sort()
+        self.layoutChanged.emit()
+
+    def _apply_sort(self) -> None:
+        # Build one int permutation over the contiguous key array instead of
+        # comparing per-entry objects; directories sort before files.
+        is_dir = self._is_dir
+        if self._sort_column == COL_SIZE:
+            keys = self._sizes
+        elif self._sort_column == COL_MODIFIED:
+            keys = self._mtimes
+        else:
+            keys = [name.lower() for name in self._names]
+        order = sorted(range(len(self._names)), key=lambda i: (not is_dir[i], keys[i]))
+        if self._sort_desc:
+            order.reverse()
+        self._order = order
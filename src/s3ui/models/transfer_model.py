@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import logging
+import os.path
+from collections import Counter
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
 
+from s3ui.models.s3_objects import _format_size
+
 if TYPE_CHECKING:
     from s3ui.db.database import Database
 
@@ -24,8 +28,21 @@ COL_STATUS = 5
 _COLUMN_HEADERS = ["", "File", "Progress", "Speed", "ETA", "Status"]
 _COLUMN_COUNT = len(_COLUMN_HEADERS)
 
-
-@dataclass
+# Which columns each buffered field renders into, so a flush can narrow its
+# dataChanged emits to the columns that actually changed. Progress bytes also
+# feed the status column, which shows a percentage for in-progress rows.
+_FIELD_TO_COLS = {
+    "transferred_bytes": (COL_PROGRESS, COL_STATUS),
+    "total_bytes": (COL_PROGRESS, COL_STATUS),
+    "speed_bps": (COL_SPEED,),
+    "eta_seconds": (COL_ETA,),
+    "_smoothed_eta": (COL_ETA,),
+    "status": (COL_STATUS,),
+    "error_message": (COL_STATUS,),
+}
+
+
+@dataclass(slots=True)
 class TransferRow:
     """In-memory representation of a transfer for display."""
 
@@ -41,6 +58,9 @@ class TransferRow:
     _smoothed_eta: float = 0.0
     status: str = "queued"
     error_message: str = ""
+    # (transferred, total, formatted pct), so repaints of an unchanged
+    # in-progress row reuse the last string.
+    _pct_cache: tuple[int, int, str] = (-1, -1, "")
 
 
 def _format_speed(bps: float) -> str:
@@ -63,16 +83,6 @@ def _format_eta(seconds: float) -> str:
     return f"~{seconds / 3600:.1f} hr"
 
 
-def _format_size(size_bytes: int) -> str:
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    if size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    if size_bytes < 1024**3:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    return f"{size_bytes / (1024**3):.1f} GB"
-
-
 def _format_progress(transferred: int, total: int) -> str:
     if total <= 0:
         return _format_size(transferred) if transferred > 0 else ""
@@ -86,17 +96,28 @@ def _format_pct(transferred: int, total: int) -> str:
     return f"{pct:.0f}%"
 
 
+# Constant display labels; only in_progress needs per-row formatting.
+_STATIC_STATUS_LABELS = {
+    "completed": "Complete",
+    "failed": "Failed",
+    "cancelled": "Cancelled",
+    "paused": "Paused",
+    "queued": "Queued",
+}
+
+
 def _format_status(row: TransferRow) -> str:
-    if row.status == "completed":
-        return "Complete"
-    if row.status == "failed":
-        return "Failed"
-    if row.status == "cancelled":
-        return "Cancelled"
-    if row.status == "paused":
-        return "Paused"
+    label = _STATIC_STATUS_LABELS.get(row.status)
+    if label is not None:
+        return label
     if row.status == "in_progress":
-        return _format_pct(row.transferred_bytes, row.total_bytes)
+        done, total = row.transferred_bytes, row.total_bytes
+        cached = row._pct_cache
+        if cached[0] == done and cached[1] == total:
+            return cached[2]
+        pct = _format_pct(done, total)
+        row._pct_cache = (done, total, pct)
+        return pct
     return "Queued"
 
 
@@ -112,10 +133,16 @@ class TransferModel(QAbstractTableModel):
         self._id_to_row: dict[int, int] = {}
         self._pending_updates: dict[int, dict] = {}
         self._dirty_rows: set[int] = set()
+        self._dirty_cols: set[int] = set()
+        # Rows per status, maintained on insert and status transition, so the
+        # 100 ms tick and the count accessors stay O(1) as history grows.
+        self._status_counts: Counter[str] = Counter()
 
-        # Coalescing timer
+        # Coalescing timer, armed on demand by _buffer_update: single-shot so
+        # the event loop stays quiet when no updates are flowing.
         self._timer = QTimer(self)
         self._timer.setInterval(100)
+        self._timer.setSingleShot(True)
         self._timer.timeout.connect(self._flush_updates)
 
     # --- Qt model interface ---
@@ -188,35 +215,44 @@ class TransferModel(QAbstractTableModel):
 
     def add_transfer(self, transfer_id: int) -> None:
         """Add a transfer from the database."""
-        if self._db is None:
-            return
-        db_row = self._db.fetchone("SELECT * FROM transfers WHERE id = ?", (transfer_id,))
-        if not db_row:
-            return
-
-        from pathlib import Path
-
-        filename = Path(db_row["local_path"]).name
+        self.add_transfers([transfer_id])
 
-        row = TransferRow(
-            transfer_id=transfer_id,
-            direction=db_row["direction"],
-            filename=filename,
-            local_path=db_row["local_path"],
-            s3_key=db_row["object_key"],
-            total_bytes=db_row["total_bytes"] or 0,
-            transferred_bytes=db_row["transferred"] or 0,
-            status=db_row["status"],
+    def add_transfers(self, transfer_ids: list[int]) -> None:
+        """Add a batch of transfers from the database with one model insert."""
+        if self._db is None or not transfer_ids:
+            return
+        placeholders = ",".join("?" * len(transfer_ids))
+        db_rows = self._db.fetchall(
+            f"SELECT * FROM transfers WHERE id IN ({placeholders})",
+            tuple(transfer_ids),
         )
+        rows_by_id = {db_row["id"]: db_row for db_row in db_rows}
 
-        idx = len(self._rows)
-        self.beginInsertRows(QModelIndex(), idx, idx)
-        self._rows.append(row)
-        self._id_to_row[transfer_id] = idx
-        self.endInsertRows()
+        new_rows = []
+        for transfer_id in transfer_ids:
+            db_row = rows_by_id.get(transfer_id)
+            if not db_row:
+                continue
+            new_rows.append(
+                TransferRow(
+                    transfer_id=transfer_id,
+                    direction=db_row["direction"],
+                    filename=os.path.basename(db_row["local_path"]),
+                    local_path=db_row["local_path"],
+                    s3_key=db_row["object_key"],
+                    total_bytes=db_row["total_bytes"] or 0,
+                    transferred_bytes=db_row["transferred"] or 0,
+                    status=db_row["status"],
+                )
+            )
+        if not new_rows:
+            return
 
-        if not self._timer.isActive():
-            self._timer.start()
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(new_rows) - 1)
+        for row in new_rows:
+            self._append_row(row)
+        self.endInsertRows()
 
     def get_transfer_row(self, transfer_id: int) -> TransferRow | None:
         idx = self._id_to_row.get(transfer_id)
@@ -254,14 +290,25 @@ class TransferModel(QAbstractTableModel):
 
     # --- Internal ---
 
+    def _append_row(self, row: TransferRow) -> None:
+        """Append a row, keeping the id index and status counters in sync."""
+        self._id_to_row[row.transfer_id] = len(self._rows)
+        self._rows.append(row)
+        self._status_counts[row.status] += 1
+
     def _buffer_update(self, transfer_id: int, **fields) -> None:
-        if transfer_id not in self._pending_updates:
-            self._pending_updates[transfer_id] = {}
-        self._pending_updates[transfer_id].update(fields)
+        # Single setdefault instead of a contains-check plus two lookups;
+        # this runs at the signal rate of every active transfer worker.
+        self._pending_updates.setdefault(transfer_id, {}).update(fields)
 
         idx = self._id_to_row.get(transfer_id)
         if idx is not None:
             self._dirty_rows.add(idx)
+            for field_name in fields:
+                self._dirty_cols.update(_FIELD_TO_COLS.get(field_name, ()))
+
+        if not self._timer.isActive():
+            self._timer.start()
 
     def _flush_updates(self) -> None:
         if not self._pending_updates:
@@ -274,25 +321,41 @@ class TransferModel(QAbstractTableModel):
             row = self._rows[idx]
             for field_name, value in fields.items():
                 if hasattr(row, field_name):
+                    if field_name == "status" and value != row.status:
+                        self._status_counts[row.status] -= 1
+                        self._status_counts[value] += 1
                     setattr(row, field_name, value)
 
         if self._dirty_rows:
-            min_row = min(self._dirty_rows)
-            max_row = max(self._dirty_rows)
-            top_left = self.index(min_row, 0)
-            bottom_right = self.index(max_row, _COLUMN_COUNT - 1)
-            self.dataChanged.emit(top_left, bottom_right)
+            # Emit one dataChanged per contiguous run of dirty rows instead of
+            # a single min..max span that repaints every clean row in between,
+            # bounded to the columns the buffered fields actually touched.
+            display_role = [Qt.ItemDataRole.DisplayRole]
+            col_first = min(self._dirty_cols, default=COL_PROGRESS)
+            col_last = max(self._dirty_cols, default=COL_STATUS)
+            dirty = sorted(self._dirty_rows)
+            start = prev = dirty[0]
+            for row_idx in dirty[1:]:
+                if row_idx != prev + 1:
+                    self.dataChanged.emit(
+                        self.index(start, col_first),
+                        self.index(prev, col_last),
+                        display_role,
+                    )
+                    start = row_idx
+                prev = row_idx
+            self.dataChanged.emit(
+                self.index(start, col_first),
+                self.index(prev, col_last),
+                display_role,
+            )
 
         self._pending_updates.clear()
         self._dirty_rows.clear()
-
-        # Stop timer if no active transfers
-        has_active = any(r.status in ("queued", "in_progress", "paused") for r in self._rows)
-        if not has_active:
-            self._timer.stop()
+        self._dirty_cols.clear()
 
     def active_count(self) -> int:
-        return sum(1 for r in self._rows if r.status == "in_progress")
+        return self._status_counts["in_progress"]
 
     def queued_count(self) -> int:
-        return sum(1 for r in self._rows if r.status == "queued")
+        return self._status_counts["queued"]
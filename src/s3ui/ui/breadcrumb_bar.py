@@ -1,6 +1,7 @@
 """Clickable breadcrumb path bar with edit mode."""
 
 import sys
+from html import escape
 from pathlib import Path
 
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -13,6 +14,12 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+_UNIX_ROOT = sys.platform != "win32"
+
+# Above this many segments, render one rich-text label instead of a widget
+# per segment; Qt layout cost grows super-linearly with child count.
+_DENSE_THRESHOLD = 10
+
 
 class BreadcrumbBar(QWidget):
     """Breadcrumb navigation bar.
@@ -40,6 +47,24 @@ class BreadcrumbBar(QWidget):
         self._edit.returnPressed.connect(self._on_edit_accepted)
         self._edit.installEventFilter(self)
 
+        # Pooled segment widgets, grown on demand and hidden when unused so a
+        # path change retexts existing buttons instead of rebuilding widgets.
+        self._sep_labels: list[QLabel] = []
+        self._btns: list[QToolButton] = []
+
+        # Single-label rendering for deep paths (see _DENSE_THRESHOLD)
+        self._dense_label = QLabel()
+        self._dense_label.setTextFormat(Qt.TextFormat.RichText)
+        self._dense_label.setOpenExternalLinks(False)
+        self._dense_label.linkActivated.connect(self.path_clicked.emit)
+        self._dense_label.setVisible(False)
+        self._layout.addWidget(self._dense_label)
+
+        # Spacer to fill remaining width (clicking it enters edit mode)
+        self._spacer = QWidget()
+        self._spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self._layout.addWidget(self._spacer)
+
         # Clickable area to enter edit mode
         self.setMouseTracking(True)
         self.setCursor(Qt.CursorShape.IBeamCursor)
@@ -54,53 +79,94 @@ class BreadcrumbBar(QWidget):
         return self._current_path
 
     def _rebuild_segments(self) -> None:
-        # Clear existing widgets (except the edit line)
-        while self._layout.count():
-            item = self._layout.takeAt(0)
-            widget = item.widget()
-            if widget and widget is not self._edit:
-                widget.deleteLater()
-
-        if not self._current_path:
-            return
-
         # Parse path into segments
-        if self._separator == "/":
+        if not self._current_path:
+            parts = []
+        elif self._separator == "/":
             parts = Path(self._current_path).parts
         else:
             parts = self._current_path.split(self._separator)
             parts = [p for p in parts if p]
 
+        # Deep paths render as one rich-text label with a link per segment,
+        # avoiding a layout pass over dozens of child widgets
+        if len(parts) > _DENSE_THRESHOLD:
+            for btn in self._btns:
+                btn.setVisible(False)
+            for sep in self._sep_labels:
+                sep.setVisible(False)
+            self._dense_label.setText(
+                self._separator.join(
+                    f'<a href="{escape(segment_path)}">{escape(part)}</a>'
+                    for part, segment_path in self._iter_segments(parts)
+                )
+            )
+            self._dense_label.setVisible(True)
+            self._spacer.setVisible(True)
+            return
+        self._dense_label.setVisible(False)
+
+        # Hide pooled widgets beyond what this path needs
+        for btn in self._btns[len(parts) :]:
+            btn.setVisible(False)
+        for sep in self._sep_labels[max(len(parts) - 1, 0) :]:
+            sep.setVisible(False)
+        self._spacer.setVisible(True)
+
+        if not parts:
+            return
+
         # Build segment buttons
-        for i, part in enumerate(parts):
+        for i, (part, segment_path) in enumerate(self._iter_segments(parts)):
             if i > 0:
-                sep = QLabel(self._separator)
-                sep.setStyleSheet("color: gray; padding: 0 2px;")
-                self._layout.addWidget(sep)
-
-            btn = QToolButton()
-            btn.setText(part)
-            btn.setAutoRaise(True)
-            btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
-
-            # Build the path up to this segment
-            if self._separator == "/":
-                segment_path = str(Path(*parts[: i + 1]))
-                # On Unix, ensure root starts with /
-                if sys.platform != "win32" and not segment_path.startswith("/"):
-                    segment_path = "/" + segment_path
+                if i - 1 < len(self._sep_labels):
+                    self._sep_labels[i - 1].setVisible(True)
+                else:
+                    sep = QLabel(self._separator)
+                    sep.setStyleSheet("color: gray; padding: 0 2px;")
+                    self._sep_labels.append(sep)
+                    self._layout.insertWidget(self._layout.indexOf(self._spacer), sep)
+
+            if i < len(self._btns):
+                btn = self._btns[i]
+                btn.setText(part)
+                btn.setVisible(True)
             else:
-                segment_path = self._separator.join(parts[: i + 1])
-                if not segment_path.endswith(self._separator):
-                    segment_path += self._separator
-
-            btn.clicked.connect(lambda checked, p=segment_path: self.path_clicked.emit(p))
-            self._layout.addWidget(btn)
+                btn = QToolButton()
+                btn.setText(part)
+                btn.setAutoRaise(True)
+                btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
+                btn.clicked.connect(self._on_segment_clicked)
+                self._btns.append(btn)
+                self._layout.insertWidget(self._layout.indexOf(self._spacer), btn)
+
+            btn.setProperty("segment_path", segment_path)
+
+    def _iter_segments(self, parts):
+        """Yield (part, path-up-to-part), accumulating the prefix as we go so
+        each iteration does O(1) string work instead of re-joining."""
+        posix = self._separator == "/"
+        acc = ""
+        for i, part in enumerate(parts):
+            if posix:
+                if i == 0:
+                    acc = part
+                    # On Unix, ensure root starts with /
+                    if _UNIX_ROOT and not acc.startswith("/"):
+                        acc = "/" + acc
+                elif acc.endswith("/"):
+                    acc += part
+                else:
+                    acc = acc + "/" + part
+                yield part, acc
+            else:
+                acc = part if i == 0 else acc + self._separator + part
+                yield part, acc + self._separator
 
-        # Spacer to fill remaining width (clicking it enters edit mode)
-        spacer = QWidget()
-        spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        self._layout.addWidget(spacer)
+    def _on_segment_clicked(self, _checked: bool = False) -> None:
+        # One slot shared by every pooled button; the target path rides on the
+        # button itself, so rebuilds never reconnect or allocate closures.
+        self.path_clicked.emit(self.sender().property("segment_path"))
 
     def _enter_edit_mode(self) -> None:
         self._editing = True
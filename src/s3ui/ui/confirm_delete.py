@@ -34,10 +34,9 @@ class DeleteConfirmDialog(QDialog):
             QLabel(f"Are you sure you want to delete {count} item{'s' if count != 1 else ''}?")
         )
 
-        # File list (first 10)
+        # File list (first 10), added in one batch so Qt lays out once
         file_list = QListWidget()
-        for key in keys[:10]:
-            file_list.addItem(key)
+        file_list.addItems(keys[:10])
         if count > 10:
             file_list.addItem(f"...and {count - 10} more")
         file_list.setMaximumHeight(200)
@@ -2,26 +2,62 @@
 
 from __future__ import annotations
 
+import contextlib
+import csv
+import os
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QFileDialog,
+    QHeaderView,
     QLabel,
+    QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
 if TYPE_CHECKING:
     from s3ui.core.cost import CostTracker
 
+_COLUMN_HEADERS = ["Date", "Requests", "Upload", "Download", "Est. Cost"]
+_COLUMN_COUNT = len(_COLUMN_HEADERS)
+
+# Usage map values: (put, get, list, delete, head, copy, uploaded,
+# downloaded, total_reqs). A shared zero tuple as the dict.get default lets
+# empty days take the same branch-free indexing path as populated ones.
+_ZERO_USAGE = (0,) * 9
+
+
+@lru_cache(maxsize=8)
+def _range_iso(today_ord: int, days: int) -> tuple[str, str]:
+    """(start_iso, end_iso) covering ``days`` days ending today.
+
+    Keyed by today's ordinal so entries refresh at midnight; both the
+    dashboard load and the export hit this, which also keeps their strings
+    identical for the tracker's query-cache keys.
+    """
+    end = date.fromordinal(today_ord)
+    return (end - timedelta(days=days - 1)).isoformat(), end.isoformat()
+
 
+@lru_cache(maxsize=4096)
 def _fmt_bytes(n: int) -> str:
-    """Human-readable byte size."""
+    """Human-readable byte size. Pure, so repeats (zero-usage days abound)
+    come from the cache."""
     if n < 1024:
         return f"{n} B"
     if n < 1024**2:
@@ -31,6 +67,134 @@ def _fmt_bytes(n: int) -> str:
     return f"{n / 1024**3:.2f} GB"
 
 
+class CostTableModel(QAbstractTableModel):
+    """Table model for the daily breakdown; cells are formatted lazily in
+    data() so only visible rows pay for string building."""
+
+    _EMPTY_INDEX = QModelIndex()
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._days: list = []
+        self._usage_map: dict = {}
+
+    def set_data(self, days: list, usage_map: dict) -> None:
+        self.beginResetModel()
+        self._days = days
+        self._usage_map = usage_map
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = _EMPTY_INDEX) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._days)
+
+    def columnCount(self, parent: QModelIndex = _EMPTY_INDEX) -> int:
+        if parent.isValid():
+            return 0
+        return _COLUMN_COUNT
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < _COLUMN_COUNT
+        ):
+            return _COLUMN_HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        if index.row() >= len(self._days):
+            return None
+
+        day = self._days[index.row()]
+        col = index.column()
+        if col == 0:
+            return day.date
+        if col == 4:
+            return f"${day.total:.4f}"
+
+        usage = self._usage_map.get(day.date, _ZERO_USAGE)
+        if col == 1:
+            return f"{usage[8]:,}"
+        if col == 2:
+            return _fmt_bytes(usage[6])
+        if col == 3:
+            return _fmt_bytes(usage[7])
+        return None
+
+
+def _write_cost_csv(path: str, days: list, usage_map: dict) -> None:
+    """Write the export file; shared by the worker below."""
+
+    def rows():
+        for day in days:
+            usage = usage_map.get(day.date, _ZERO_USAGE)
+            yield (
+                day.date,
+                *usage[:8],
+                f"{day.storage:.6f}",
+                f"{day.requests:.6f}",
+                f"{day.transfer:.6f}",
+                f"{day.total:.6f}",
+            )
+
+    # Write to a sibling temp file and rename into place so a crash or kill
+    # mid-export can never leave a truncated CSV at the chosen path. Large
+    # buffer + writerows keeps the write() syscall count to a handful
+    # instead of one per row.
+    tmp_path = path + ".part"
+    try:
+        with open(tmp_path, "w", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "date", "put_requests", "get_requests", "list_requests",
+                    "delete_requests", "head_requests", "copy_requests",
+                    "bytes_uploaded", "bytes_downloaded",
+                    "storage_cost", "request_cost", "transfer_cost", "total_cost",
+                ]
+            )
+            writer.writerows(rows())
+            # One fsync at the end: durable on disk before the rename
+            # publishes the file, with none of the per-line flush cost
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+class _CsvExportSignals(QObject):
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class _CsvExportWorker(QRunnable):
+    """Writes the export file off the GUI thread so slow disks don't stall it."""
+
+    def __init__(self, path: str, days: list, usage_map: dict) -> None:
+        super().__init__()
+        self.signals = _CsvExportSignals()
+        self._path = path
+        self._days = days
+        self._usage_map = usage_map
+
+    def run(self) -> None:
+        try:
+            _write_cost_csv(self._path, self._days, self._usage_map)
+        except OSError as exc:
+            self.signals.failed.emit(str(exc))
+        else:
+            self.signals.finished.emit()
+
+
 class CostDialog(QDialog):
     """Shows monthly cost estimate and daily breakdown."""
 
@@ -49,19 +213,19 @@ class CostDialog(QDialog):
 
         # Daily breakdown table
         layout.addWidget(QLabel("Daily Breakdown (last 30 days):"))
-        self._daily_table = QTableWidget()
-        self._daily_table.setColumnCount(5)
-        self._daily_table.setHorizontalHeaderLabels(
-            ["Date", "Requests", "Upload", "Download", "Est. Cost"]
-        )
+        self._daily_model = CostTableModel(self)
+        self._daily_table = QTableView()
+        self._daily_table.setModel(self._daily_model)
+        # Fixed row heights keep Qt from probing every row for sizing
+        self._daily_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         layout.addWidget(self._daily_table)
 
         # Buttons
         btn_layout = QDialogButtonBox()
 
-        export_btn = QPushButton("Export CSV")
-        export_btn.clicked.connect(self._export_csv)
-        btn_layout.addButton(export_btn, QDialogButtonBox.ButtonRole.ActionRole)
+        self._export_btn = QPushButton("Export CSV")
+        self._export_btn.clicked.connect(self._export_csv)
+        btn_layout.addButton(self._export_btn, QDialogButtonBox.ButtonRole.ActionRole)
 
         close_btn = btn_layout.addButton(QDialogButtonBox.StandardButton.Close)
         close_btn.clicked.connect(self.accept)
@@ -69,57 +233,44 @@ class CostDialog(QDialog):
 
         self._load_data()
 
+    def set_cost_tracker(self, cost_tracker: CostTracker | None) -> None:
+        """Point the dialog at a different tracker (allows instance reuse)."""
+        self._cost = cost_tracker
+        self._load_data()
+
     def _load_data(self) -> None:
         if not self._cost:
             return
 
-        estimate = self._cost.get_monthly_estimate()
+        start, end = _range_iso(date.today().toordinal(), 30)
+        estimate, days = self._cost.get_dashboard(start, end)
         self._estimate_label.setText(f"Estimated cost this month: ${estimate:.4f}")
 
-        today = date.today()
-        start = (today - timedelta(days=29)).isoformat()
-        end = today.isoformat()
-        days = self._cost.get_daily_costs(start, end)
-
         # Get raw usage rows for request counts and byte totals
         usage_map = self._build_usage_map(start, end)
-
-        self._daily_table.setRowCount(len(days))
-        for i, day in enumerate(days):
-            self._daily_table.setItem(i, 0, QTableWidgetItem(day.date))
-
-            usage = usage_map.get(day.date)
-            if usage:
-                total_reqs = (
-                    (usage["put_requests"] or 0)
-                    + (usage["get_requests"] or 0)
-                    + (usage["list_requests"] or 0)
-                    + (usage["delete_requests"] or 0)
-                    + (usage["head_requests"] or 0)
-                    + (usage["copy_requests"] or 0)
-                )
-                upload = usage["bytes_uploaded"] or 0
-                download = usage["bytes_downloaded"] or 0
-            else:
-                total_reqs = 0
-                upload = 0
-                download = 0
-
-            self._daily_table.setItem(i, 1, QTableWidgetItem(f"{total_reqs:,}"))
-            self._daily_table.setItem(i, 2, QTableWidgetItem(_fmt_bytes(upload)))
-            self._daily_table.setItem(i, 3, QTableWidgetItem(_fmt_bytes(download)))
-            self._daily_table.setItem(i, 4, QTableWidgetItem(f"${day.total:.4f}"))
+        self._daily_model.set_data(days, usage_map)
 
     def _build_usage_map(self, start: str, end: str) -> dict:
-        """Query raw daily_usage rows and index by date."""
+        """Query raw daily_usage rows and index flat int tuples by date."""
         if not self._cost or not self._cost._db:
             return {}
-        rows = self._cost._db.fetchall(
-            "SELECT * FROM daily_usage WHERE bucket_id = ? "
-            "AND usage_date >= ? AND usage_date <= ? ORDER BY usage_date",
-            (self._cost._bucket_id, start, end),
-        )
-        return {row["usage_date"]: row for row in rows}
+        # The tracker caches range queries, so repeat opens and same-range
+        # exports share one result set
+        rows = self._cost.get_usage_rows(start, end)
+        return {
+            row["usage_date"]: (
+                row["put_requests"] or 0,
+                row["get_requests"] or 0,
+                row["list_requests"] or 0,
+                row["delete_requests"] or 0,
+                row["head_requests"] or 0,
+                row["copy_requests"] or 0,
+                row["upload"],
+                row["download"],
+                row["total_reqs"],
+            )
+            for row in rows
+        }
 
     def _export_csv(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -128,36 +279,19 @@ class CostDialog(QDialog):
         if not path or not self._cost:
             return
 
-        today = date.today()
-        start = (today - timedelta(days=364)).isoformat()
-        end = today.isoformat()
+        start, end = _range_iso(date.today().toordinal(), 365)
         days = self._cost.get_daily_costs(start, end)
         usage_map = self._build_usage_map(start, end)
 
-        with open(path, "w") as f:
-            f.write(
-                "date,put_requests,get_requests,list_requests,delete_requests,"
-                "head_requests,copy_requests,bytes_uploaded,bytes_downloaded,"
-                "storage_cost,request_cost,transfer_cost,total_cost\n"
-            )
-            for day in days:
-                usage = usage_map.get(day.date)
-                if usage:
-                    f.write(
-                        f"{day.date},{usage['put_requests'] or 0},"
-                        f"{usage['get_requests'] or 0},"
-                        f"{usage['list_requests'] or 0},"
-                        f"{usage['delete_requests'] or 0},"
-                        f"{usage['head_requests'] or 0},"
-                        f"{usage['copy_requests'] or 0},"
-                        f"{usage['bytes_uploaded'] or 0},"
-                        f"{usage['bytes_downloaded'] or 0},"
-                        f"{day.storage:.6f},{day.requests:.6f},"
-                        f"{day.transfer:.6f},{day.total:.6f}\n"
-                    )
-                else:
-                    f.write(
-                        f"{day.date},0,0,0,0,0,0,0,0,"
-                        f"{day.storage:.6f},0.000000,0.000000,"
-                        f"{day.storage:.6f}\n"
-                    )
+        self._export_btn.setEnabled(False)
+        worker = _CsvExportWorker(path, days, usage_map)
+        worker.signals.finished.connect(self._on_export_done)
+        worker.signals.failed.connect(self._on_export_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_export_done(self) -> None:
+        self._export_btn.setEnabled(True)
+
+    def _on_export_failed(self, message: str) -> None:
+        self._export_btn.setEnabled(True)
+        QMessageBox.warning(self, "Export Failed", message)
@@ -1,9 +1,11 @@
 """Local file system pane — left side of the dual-pane browser."""
 
 import logging
-from pathlib import Path
+import os
+from collections import deque
+from functools import lru_cache
 
-from PyQt6.QtCore import QDir, QModelIndex, Qt, QUrl, pyqtSignal
+from PyQt6.QtCore import QDir, QModelIndex, Qt, QTimer, QUrl, pyqtSignal
 from PyQt6.QtGui import QDesktopServices, QFileSystemModel
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -29,10 +31,26 @@ class LocalPaneWidget(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._history_back: list[str] = []
-        self._history_forward: list[str] = []
-        self._current_path = str(Path.home())
+        # deque(maxlen=...) discards the oldest entry in O(1) when full,
+        # instead of re-slicing the list on every navigation past the cap
+        self._history_back: deque[str] = deque(maxlen=NAV_HISTORY_MAX)
+        self._history_forward: deque[str] = deque(maxlen=NAV_HISTORY_MAX)
+        self._current_path = os.path.expanduser("~")
         self._show_hidden = False
+        # Listing backend: "native" (QFileSystemModel) or "scandir"
+        # (ScanDirModel, opt-in for very large directories)
+        self._backend = "native"
+        self._scandir_model = None
+
+        # Footer recompute is debounced (navigations and directoryLoaded
+        # fire in bursts), cached per (path, dir mtime), and chunked across
+        # event-loop ticks so huge directories don't stall the UI.
+        self._footer_timer = QTimer(self)
+        self._footer_timer.setSingleShot(True)
+        self._footer_timer.setInterval(150)
+        self._footer_timer.timeout.connect(self._recompute_footer)
+        self._footer_cache: dict[tuple[str, int], tuple[int, int]] = {}
+        self._footer_job = 0
 
         self._setup_ui()
         self._setup_model()
@@ -116,19 +134,21 @@ class LocalPaneWidget(QWidget):
 
     def navigate_to(self, path: str, record_history: bool = True) -> None:
         """Navigate to a directory path."""
-        p = Path(path)
-        if not p.is_dir():
+        # os.path over pathlib here: navigation fires on every click and
+        # Back/Forward keypress, and Path() allocates several objects per call
+        if not os.path.isdir(path):
             return
 
         if record_history and self._current_path != path:
             self._history_back.append(self._current_path)
-            if len(self._history_back) > NAV_HISTORY_MAX:
-                self._history_back = self._history_back[-NAV_HISTORY_MAX:]
             self._history_forward.clear()
 
-        self._current_path = str(p)
-        index = self._model.index(self._current_path)
-        self._tree.setRootIndex(index)
+        self._current_path = os.path.normpath(path)
+        if self._backend == "scandir":
+            self._scandir_model.set_directory(self._current_path)
+        else:
+            index = self._model.index(self._current_path)
+            self._tree.setRootIndex(index)
         self._breadcrumb.set_path(self._current_path)
         self._update_nav_buttons()
         self._update_footer(self._current_path)
@@ -150,7 +170,7 @@ class LocalPaneWidget(QWidget):
         self.navigate_to(path, record_history=False)
 
     def go_up(self) -> None:
-        parent = str(Path(self._current_path).parent)
+        parent = os.path.dirname(self._current_path)
         if parent != self._current_path:
             self.navigate_to(parent)
 
@@ -160,20 +180,49 @@ class LocalPaneWidget(QWidget):
         if show:
             filters |= QDir.Filter.Hidden
         self._model.setFilter(filters)
+        if self._scandir_model is not None:
+            self._scandir_model.set_show_hidden(show)
+
+    def set_model(self, backend: str) -> None:
+        """Switch the listing backend: "native" or "scandir".
+
+        QFileSystemModel is fine for everyday directories; ScanDirModel
+        keeps scrolling smooth when they hold tens of thousands of entries.
+        """
+        if backend == self._backend:
+            return
+        if backend not in ("native", "scandir"):
+            raise ValueError(f"Unknown listing backend: {backend}")
+        self._backend = backend
+        if backend == "scandir":
+            if self._scandir_model is None:
+                from s3ui.models.scandir_model import ScanDirModel
+
+                self._scandir_model = ScanDirModel(self)
+                self._scandir_model.set_show_hidden(self._show_hidden)
+            self._tree.setModel(self._scandir_model)
+            self._scandir_model.set_directory(self._current_path)
+        else:
+            self._tree.setModel(self._model)
+            self._tree.setColumnHidden(2, True)
+            self._tree.setRootIndex(self._model.index(self._current_path))
+        self._tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
 
     def current_path(self) -> str:
         return self._current_path
 
     def selected_paths(self) -> list[str]:
         """Return full paths of selected items."""
+        model = self._tree.model()
         paths = []
         for idx in self._tree.selectionModel().selectedRows():
-            paths.append(self._model.filePath(idx))
+            paths.append(model.filePath(idx))
         return paths
 
     def _on_double_click(self, index: QModelIndex) -> None:
-        path = self._model.filePath(index)
-        if self._model.isDir(index):
+        model = self._tree.model()
+        path = model.filePath(index)
+        if model.isDir(index):
             self.navigate_to(path)
         else:
             QDesktopServices.openUrl(QUrl.fromLocalFile(path))
@@ -182,7 +231,7 @@ class LocalPaneWidget(QWidget):
         self.navigate_to(path)
 
     def _on_breadcrumb_edited(self, path: str) -> None:
-        if Path(path).is_dir():
+        if os.path.isdir(path):
             self.navigate_to(path)
 
     def _update_nav_buttons(self) -> None:
@@ -190,17 +239,62 @@ class LocalPaneWidget(QWidget):
         self._forward_btn.setEnabled(len(self._history_forward) > 0)
 
     def _update_footer(self, path: str = "") -> None:
+        """Schedule a footer recompute; bursts coalesce into one pass."""
+        self._footer_timer.start()
+
+    def _recompute_footer(self) -> None:
+        path = self._current_path
         try:
-            index = self._model.index(self._current_path)
-            count = self._model.rowCount(index)
-            total_size = 0
-            for i in range(count):
-                child = self._model.index(i, 0, index)
-                if not self._model.isDir(child):
-                    total_size += self._model.size(child)
-
-            size_str = _format_size(total_size)
-            self._footer.setText(f"{count} items, {size_str}")
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = -1
+        cached = self._footer_cache.get((path, mtime))
+        if cached is not None:
+            self._set_footer(*cached)
+            return
+
+        self._footer_job += 1
+        job = self._footer_job
+        # os.scandir batches the stat work in C instead of a QFileInfo
+        # round-trip through the model for every row
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            return
+        show_hidden = self._show_hidden
+        count = 0
+        total = 0
+
+        def step() -> None:
+            nonlocal count, total
+            if job != self._footer_job or path != self._current_path:
+                entries.close()
+                return  # superseded by a newer navigation
+            processed = 0
+            for entry in entries:
+                if not show_hidden and entry.name.startswith("."):
+                    continue
+                count += 1
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                processed += 1
+                if processed >= 2000:
+                    QTimer.singleShot(0, step)
+                    return
+            entries.close()
+            if len(self._footer_cache) > 256:
+                self._footer_cache.clear()
+            self._footer_cache[(path, mtime)] = (count, total)
+            self._set_footer(count, total)
+
+        step()
+
+    def _set_footer(self, count: int, total_size: int) -> None:
+        try:
+            self._footer.setText(f"{count} items, {_format_size(total_size)}")
         except RuntimeError:
             return  # C++ widget already deleted during shutdown
 
@@ -217,6 +311,7 @@ class LocalPaneWidget(QWidget):
         menu.exec(self._tree.viewport().mapToGlobal(pos))
 
 
+@lru_cache(maxsize=4096)
 def _format_size(size_bytes: int) -> str:
     """Format bytes into human-readable string."""
     if size_bytes < 1024:
@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import (
     QEvent,
     QModelIndex,
     QObject,
+    QRunnable,
     QSortFilterProxyModel,
     Qt,
-    QThread,
+    QThreadPool,
+    QTimer,
     pyqtSignal,
 )
 from PyQt6.QtWidgets import (
@@ -20,14 +25,23 @@ from PyQt6.QtWidgets import (
     QHeaderView,
     QLabel,
     QLineEdit,
+    QMenu,
     QTableView,
     QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
-from s3ui.constants import NAV_HISTORY_MAX
+from s3ui.constants import (
+    FILTER_DEBOUNCE_MS,
+    MAX_CONCURRENT_FETCHES,
+    MAX_FETCH_THREADS,
+    NAV_HISTORY_MAX,
+    PREFETCH_CHILD_PREFIXES,
+)
+from s3ui.core.key_trie import KeyTrie
 from s3ui.core.listing_cache import ListingCache
+from s3ui.core.persistent_cache import PersistentListingCache, listing_etag
 from s3ui.models.s3_objects import S3Item, S3ObjectModel, _format_size
 from s3ui.ui.breadcrumb_bar import BreadcrumbBar
 
@@ -37,16 +51,49 @@ if TYPE_CHECKING:
 logger = logging.getLogger("s3ui.s3_pane")
 
 
+@lru_cache(maxsize=512)
+def _path_to_prefix(bucket: str, path: str) -> str:
+    """Normalize a breadcrumb path to an S3 prefix ("" for root).
+
+    Memoized — back/forward scrubbing and breadcrumb clicks revisit the
+    same handful of paths constantly.
+    """
+    if bucket and path.startswith(bucket):
+        prefix = path[len(bucket) :]
+        if prefix.startswith("/"):
+            prefix = prefix[1:]
+    else:
+        prefix = path
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+    # Root is empty string, not "/"
+    if prefix == "/":
+        prefix = ""
+    return prefix
+
+
+@lru_cache(maxsize=512)
+def _display_path(bucket: str, prefix: str) -> str:
+    """Breadcrumb display string for a bucket/prefix pair."""
+    return f"{bucket}/{prefix}" if bucket else ""
+
 class _FetchSignals(QObject):
     """Signals emitted by the fetch worker."""
 
     page_ready = pyqtSignal(str, list, bool, int)  # prefix, items, is_first_page, fetch_id
     listing_complete = pyqtSignal(str, list, int)  # prefix, all_items, fetch_id
     error = pyqtSignal(str, str, int)  # prefix, error_message, fetch_id
+    dropped = pyqtSignal(str, int)  # prefix, fetch_id — optional fetch never ran
 
 
-class _FetchWorker(QThread):
-    """Background thread for fetching S3 listings."""
+class _FetchRunnable(QRunnable):
+    """Pool task that fetches one prefix listing.
+
+    Pooled threads are reused across navigations, so each directory change
+    skips OS thread spawn and rides boto3's already-warm HTTPS connection
+    pool instead of paying a fresh TLS handshake. Stale results are simply
+    discarded via the fetch_id generation counter — no cancellation needed.
+    """
 
     def __init__(
         self,
@@ -54,22 +101,74 @@ class _FetchWorker(QThread):
         bucket: str,
         prefix: str,
         fetch_id: int,
-        parent: QObject | None = None,
+        semaphore: threading.BoundedSemaphore,
+        optional: bool = False,
     ) -> None:
-        super().__init__(parent)
+        super().__init__()
         self.signals = _FetchSignals()
         self._s3 = s3_client
         self._bucket = bucket
         self._prefix = prefix
         self._fetch_id = fetch_id
+        self._sem = semaphore
+        self._optional = optional
 
     def run(self) -> None:
+        # Bound in-flight ListObjectsV2 calls so breadcrumb/back-forward
+        # mashing can't queue up enough requests to draw 503 SlowDown.
+        # Optional fetches (background revalidations) are simply dropped
+        # when saturated — the entry revalidates on a later navigation.
+        if self._optional:
+            if not self._sem.acquire(blocking=False):
+                logger.debug("Dropping revalidation for '%s': fetches saturated", self._prefix)
+                self.signals.dropped.emit(self._prefix, self._fetch_id)
+                return
+        else:
+            self._sem.acquire()
         try:
-            items, _ = self._s3.list_objects(self._bucket, self._prefix)
+            on_page = None
+            if not self._optional:
+                # Stream pages so the view fills within one S3 round trip;
+                # revalidations stay silent until the final diff
+                first = True
+
+                def on_page(page_items: list) -> None:
+                    nonlocal first
+                    self.signals.page_ready.emit(self._prefix, page_items, first, self._fetch_id)
+                    first = False
+
+            items, _ = self._s3.list_objects(self._bucket, self._prefix, on_page=on_page)
             self.signals.listing_complete.emit(self._prefix, items, self._fetch_id)
         except Exception as e:
             logger.error("Fetch failed for prefix '%s': %s", self._prefix, e)
             self.signals.error.emit(self._prefix, str(e), self._fetch_id)
+        finally:
+            self._sem.release()
+
+
+class _S3FilterProxy(QSortFilterProxyModel):
+    """Name filter that bypasses Qt's regex machinery.
+
+    setFilterFixedString compiles a regex and round-trips every row's
+    DisplayRole through the model on each keystroke; the filter bar only
+    needs a case-insensitive substring check, so filterAcceptsRow reads the
+    item's precomputed lowercase name directly.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._needle = ""
+
+    def set_needle(self, text: str) -> None:
+        self._needle = text.lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._needle:
+            return True
+        item = self.sourceModel().get_item(source_row)
+        # _sort_tuple[1] is the item's cached lowercase name
+        return item is not None and self._needle in item._sort_tuple[1]
 
 
 class S3PaneWidget(QWidget):
@@ -91,11 +190,23 @@ class S3PaneWidget(QWidget):
         self._current_prefix: str = ""
         self._history_back: list[str] = []
         self._history_forward: list[str] = []
+        # Saved (back, forward, prefix) navigation state per bucket
+        self._bucket_history: dict[str, tuple[list[str], list[str], str]] = {}
         self._fetch_id: int = 0
-        self._fetch_worker: _FetchWorker | None = None
+        self._fetch_pool = QThreadPool(self)
+        self._fetch_pool.setMaxThreadCount(MAX_FETCH_THREADS)
+        self._fetch_sem = threading.BoundedSemaphore(MAX_CONCURRENT_FETCHES)
+        # In-flight fetches keyed by (bucket, prefix) -> latest fetch_id;
+        # repeat requests for the same prefix attach instead of re-fetching
+        self._inflight: dict[tuple[str, str], int] = {}
         self._cache = ListingCache()
+        try:
+            self._persist: PersistentListingCache | None = PersistentListingCache()
+        except Exception as e:  # unusable disk cache — run memory-only
+            logger.warning("Persistent listing cache unavailable: %s", e)
+            self._persist = None
         self._connected = False
-        self._operation_locks: dict[str, str] = {}
+        self._operation_locks = KeyTrie()
 
         self._setup_ui()
 
@@ -157,12 +268,18 @@ class S3PaneWidget(QWidget):
         self._filter_bar.textChanged.connect(self._on_filter_changed)
         layout.addWidget(self._filter_bar)
 
+        # Debounce keystrokes so typing a word re-filters the model once,
+        # not once per character
+        self._pending_filter = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         # Table view
         self._model = S3ObjectModel()
-        self._proxy = QSortFilterProxyModel()
+        self._proxy = _S3FilterProxy()
         self._proxy.setSourceModel(self._model)
-        self._proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self._proxy.setFilterKeyColumn(0)  # Filter on Name column
 
         self._table = QTableView()
         self._table.setModel(self._proxy)
@@ -185,6 +302,25 @@ class S3PaneWidget(QWidget):
 
         layout.addWidget(self._table, 1)
 
+        # Context menus are built once — rebuilding a QMenu plus actions
+        # and closures on every right-click is wasted allocation, and the
+        # persistent actions read the selection themselves when triggered
+        self._menu_selected = QMenu(self)
+        download_act = self._menu_selected.addAction("Download")
+        download_act.triggered.connect(self._emit_download_selected)
+        self._menu_selected.addSeparator()
+        delete_act = self._menu_selected.addAction("Delete")
+        delete_act.triggered.connect(self._emit_delete_selected)
+        self._info_separator = self._menu_selected.addSeparator()
+        self._info_act = self._menu_selected.addAction("Get Info")
+        self._info_act.triggered.connect(self._emit_get_info_selected)
+
+        self._menu_empty = QMenu(self)
+        new_folder_act = self._menu_empty.addAction("New Folder")
+        new_folder_act.triggered.connect(self.new_folder_requested.emit)
+        refresh_act = self._menu_empty.addAction("Refresh")
+        refresh_act.triggered.connect(self.refresh)
+
         # Status/error label (hidden by default)
         self._status_label = QLabel()
         self._status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -203,6 +339,9 @@ class S3PaneWidget(QWidget):
         self._footer = QLabel("0 items")
         self._footer.setContentsMargins(8, 2, 8, 2)
         self._footer.setStyleSheet("color: gray; font-size: 11px;")
+        # Last (total_size, formatted) pair — insert-only notification
+        # bursts reformat the same total over and over
+        self._footer_size_cache: tuple[int, str] = (-1, "")
         layout.addWidget(self._footer)
 
     # --- Public API ---
@@ -215,12 +354,31 @@ class S3PaneWidget(QWidget):
         self._table.setVisible(True)
 
     def set_bucket(self, bucket_name: str) -> None:
-        """Switch to a different bucket."""
+        """Switch to a different bucket.
+
+        Each bucket keeps its own cache partition and navigation history,
+        so flipping back to a recent bucket lands on the prefix you left,
+        rendered from warm cache instead of a cold fetch.
+        """
+        if self._bucket:
+            self._bucket_history[self._bucket] = (
+                self._history_back,
+                self._history_forward,
+                self._current_prefix,
+            )
         self._bucket = bucket_name
-        self._cache.invalidate_all()
-        self._history_back.clear()
-        self._history_forward.clear()
-        self.navigate_to("")
+        self._cache.set_active_bucket(bucket_name)
+        self._inflight.clear()
+        if self._persist is not None and len(self._cache) == 0:
+            # Seed a cold partition from disk as stale: previously-visited
+            # folders render instantly and revalidate on first visit
+            for prefix, items in self._persist.load_bucket(bucket_name).items():
+                self._cache.put(prefix, items, stale=True)
+        back, forward, prefix = self._bucket_history.get(bucket_name, ([], [], ""))
+        self._history_back = back
+        self._history_forward = forward
+        self._update_nav_buttons()
+        self.navigate_to(prefix, record_history=False)
 
     def navigate_to(self, prefix: str, record_history: bool = True) -> None:
         """Navigate to an S3 prefix."""
@@ -240,7 +398,8 @@ class S3PaneWidget(QWidget):
         # Check cache
         cached = self._cache.get(prefix)
         if cached is not None:
-            self._model.set_items(cached.items)
+            with self._bulk_view_update():
+                self._model.set_items(cached.items)
             self._update_footer()
             self._status_label.setVisible(False)
             self.directory_changed.emit(prefix)
@@ -280,11 +439,21 @@ class S3PaneWidget(QWidget):
         return self._current_prefix
 
     def selected_items(self) -> list[S3Item]:
-        """Return S3Items for selected rows."""
+        """Return S3Items for selected rows.
+
+        Selections are stored range-compressed, so mapping the whole
+        selection through the proxy once and walking row ranges avoids a
+        per-row mapToSource round trip — the difference between a freeze
+        and a blink when right-clicking after Select All on a big listing.
+        """
+        selection = self._table.selectionModel().selection()
+        source_selection = self._proxy.mapSelectionToSource(selection)
+        rows: set[int] = set()
+        for srange in source_selection:
+            rows.update(range(srange.top(), srange.bottom() + 1))
         items = []
-        for idx in self._table.selectionModel().selectedRows():
-            source_idx = self._proxy.mapToSource(idx)
-            item = self._model.get_item(source_idx.row())
+        for row in sorted(rows):
+            item = self._model.get_item(row)
             if item:
                 items.append(item)
         return items
@@ -299,32 +468,32 @@ class S3PaneWidget(QWidget):
             return  # Not in current directory level
         item = S3Item(name=name, key=key, is_prefix=False, size=size)
         self._model.insert_item(item)
-        self._cache.apply_mutation(prefix, lambda items: items.append(item))
+        self._cache.append_item(prefix, item)
         self._update_footer()
 
     def notify_delete_complete(self, keys: list[str]) -> None:
         """Optimistic: remove deleted objects from current listing."""
-        key_set = set(keys)
-        self._model.remove_items(key_set)
-        self._cache.apply_mutation(
-            self._current_prefix,
-            lambda items: self._remove_from_list(items, key_set),
-        )
+        # Deleting a single file is the common case — use the model's keyed
+        # single-row removal and skip hash-set construction entirely; for a
+        # handful of keys a tuple scan beats building a set
+        if len(keys) == 1:
+            self._model.remove_item(keys[0])
+        else:
+            self._model.remove_items(set(keys))
+        lookup = tuple(keys) if len(keys) <= 4 else set(keys)
+        self._cache.remove_keys(self._current_prefix, lookup)
         self._update_footer()
 
     def notify_rename_complete(self, old_key: str, new_key: str, new_name: str) -> None:
         """Optimistic: update a renamed item."""
         self._model.update_item(old_key, key=new_key, name=new_name)
-        self._cache.apply_mutation(
-            self._current_prefix,
-            lambda items: self._rename_in_list(items, old_key, new_key, new_name),
-        )
+        self._cache.rename_key(self._current_prefix, old_key, new_key, new_name)
 
     def notify_new_folder(self, key: str, name: str) -> None:
         """Optimistic: insert a new prefix (folder)."""
         item = S3Item(name=name, key=key, is_prefix=True)
         self._model.insert_item(item)
-        self._cache.apply_mutation(self._current_prefix, lambda items: items.append(item))
+        self._cache.append_item(self._current_prefix, item)
         self._update_footer()
 
     def notify_copy_complete(self, key: str, size: int) -> None:
@@ -341,17 +510,45 @@ class S3PaneWidget(QWidget):
             self._filter_bar.clear()
 
     def _on_filter_changed(self, text: str) -> None:
-        self._proxy.setFilterFixedString(text)
+        self._pending_filter = text
+        self._filter_timer.start()
+
+    def _apply_filter(self) -> None:
+        self._proxy.set_needle(self._pending_filter)
         self._update_footer()
 
     # --- Internal ---
 
-    def _launch_fetch(self, prefix: str, revalidate: bool = False, counter: int = 0) -> None:
+    def _launch_fetch(
+        self, prefix: str, revalidate: bool = False, counter: int = 0, prefetch: bool = False
+    ) -> None:
         """Launch a background fetch for the given prefix."""
-        self._fetch_id += 1
-        fetch_id = self._fetch_id
-
-        worker = _FetchWorker(self._s3_client, self._bucket, prefix, fetch_id, self)
+        if prefetch:
+            # Cache-warming only: -1 never matches the active generation,
+            # so results land in the cache without touching the UI
+            fetch_id = -1
+        else:
+            self._fetch_id += 1
+            fetch_id = self._fetch_id
+
+        # Coalesce: double-clicks and back/forward mashing ask for the same
+        # prefix repeatedly — attach to the fetch already in flight and let
+        # its completion dispatch under the newest fetch_id.
+        key = (self._bucket, prefix)
+        if key in self._inflight:
+            if not prefetch:
+                self._inflight[key] = fetch_id
+            return
+        self._inflight[key] = fetch_id
+
+        worker = _FetchRunnable(
+            self._s3_client,
+            self._bucket,
+            prefix,
+            fetch_id,
+            self._fetch_sem,
+            optional=revalidate,
+        )
 
         if revalidate:
             worker.signals.listing_complete.connect(
@@ -360,79 +557,155 @@ class S3PaneWidget(QWidget):
         else:
             worker.signals.listing_complete.connect(self._on_listing_complete)
 
+        worker.signals.page_ready.connect(self._on_page_ready)
         worker.signals.error.connect(self._on_fetch_error)
-        worker.finished.connect(worker.deleteLater)
-        self._fetch_worker = worker
-        worker.start()
+        worker.signals.dropped.connect(self._on_fetch_dropped)
+        # Prefetches queue below user-initiated fetches in the pool
+        self._fetch_pool.start(worker, -1 if prefetch else 0)
+
+    def _on_page_ready(
+        self, prefix: str, items: list[S3Item], is_first_page: bool, fetch_id: int
+    ) -> None:
+        """Populate the view progressively as listing pages arrive."""
+        if fetch_id != self._fetch_id or prefix != self._current_prefix:
+            return  # User navigated away mid-listing
+        if is_first_page:
+            self._status_label.setVisible(False)
+            with self._bulk_view_update():
+                self._model.set_items(items)
+        else:
+            self._model.insert_items(items)
+        self._update_footer()
 
     def _on_listing_complete(self, prefix: str, items: list[S3Item], fetch_id: int) -> None:
         """Handle completion of a fresh fetch."""
+        fetch_id = self._inflight.pop((self._bucket, prefix), fetch_id)
+        self._cache.put(prefix, items)
+        if self._persist is not None:
+            self._persist.store(self._bucket, prefix, items)
         if fetch_id != self._fetch_id:
-            # Stale fetch — cache the result but don't update UI
-            self._cache.put(prefix, items)
-            return
+            return  # Stale fetch — cached the result but don't update UI
 
-        self._cache.put(prefix, items)
-        self._model.set_items(items)
+        # Pages already streamed into the model, so this is normally a no-op
+        # diff; it still squares things up for fetches that were coalesced
+        # onto an earlier worker (whose page stream carried the old fetch_id)
+        with self._bulk_view_update():
+            self._model.diff_apply(items)
         self._status_label.setVisible(False)
         self._update_footer()
         self.status_message.emit(f"Loaded {len(items)} items")
+        self._prefetch_children(items)
 
     def _on_revalidation_complete(
         self, prefix: str, items: list[S3Item], fetch_id: int, counter: int
     ) -> None:
         """Handle completion of a background revalidation."""
+        fetch_id = self._inflight.pop((self._bucket, prefix), fetch_id)
+        unchanged = False
+        if self._persist is not None:
+            new_etag = listing_etag(items)
+            unchanged = self._persist.etag(self._bucket, prefix) == new_etag
+            self._persist.store(self._bucket, prefix, items, etag=new_etag)
         self._cache.safe_revalidate(prefix, items, counter)
 
         if fetch_id != self._fetch_id:
             return  # User navigated away
 
+        if unchanged and self._cache.get_mutation_counter(prefix) == counter:
+            return  # Server listing unchanged and no local mutations — nothing to diff
+
         if prefix == self._current_prefix:
             cached = self._cache.get(prefix)
             if cached:
-                self._model.diff_apply(cached.items)
+                with self._bulk_view_update():
+                    self._model.diff_apply(cached.items)
+                self._status_label.setVisible(False)
                 self._update_footer()
 
+    def _prefetch_children(self, items: list[S3Item]) -> None:
+        """Warm the cache for the first few child folders of a fresh listing.
+
+        Drill-down browsing makes the next click one of these; prefetches
+        run as optional fetches, so they yield to user-initiated requests
+        and are dropped outright when the semaphore is saturated.
+        """
+        prefetched = 0
+        for item in items:
+            if not item.is_prefix or self._cache.get(item.key) is not None:
+                continue
+            self._launch_fetch(item.key, revalidate=True, counter=0, prefetch=True)
+            prefetched += 1
+            if prefetched >= PREFETCH_CHILD_PREFIXES:
+                break
+
+    def _on_fetch_dropped(self, prefix: str, fetch_id: int) -> None:
+        """A saturated optional fetch never ran — free its in-flight slot.
+
+        A user navigation may have coalesced onto the dropped worker; if
+        the slot carries the active generation and there is nothing cached
+        to show, relaunch as a mandatory fetch so the pane doesn't sit on
+        "Loading..." until a manual refresh.
+        """
+        inflight_id = self._inflight.pop((self._bucket, prefix), None)
+        if (
+            inflight_id == self._fetch_id
+            and prefix == self._current_prefix
+            and self._cache.get(prefix) is None
+        ):
+            self._launch_fetch(prefix)
+
+    def closeEvent(self, event) -> None:
+        """Drain the fetch pool before the widget is torn down.
+
+        waitForDone releases the GIL while it blocks; leaving the wait to
+        the C++ QThreadPool destructor instead deadlocks when a pool
+        thread still needs the GIL to dispose of a just-finished runnable.
+        Queued runnables are left to run out rather than cleared — they
+        finish fast and clearing buys nothing on this path.
+        """
+        self._fetch_pool.waitForDone()
+        super().closeEvent(event)
+
     def _on_fetch_error(self, prefix: str, error_msg: str, fetch_id: int) -> None:
         """Handle fetch failure."""
+        fetch_id = self._inflight.pop((self._bucket, prefix), fetch_id)
         if fetch_id != self._fetch_id:
             return
         self._status_label.setText(f"Error loading: {error_msg}\nClick Refresh to retry.")
         self._status_label.setVisible(True)
         self.status_message.emit(f"Error: {error_msg}")
 
+    @contextmanager
+    def _bulk_view_update(self):
+        """Pause sorting and painting around a bulk model swap.
+
+        With live sorting enabled, a model reset makes the proxy re-sort and
+        re-query data() for every visible cell as rows land; bracketing the
+        swap defers that to a single pass at the end.
+        """
+        self._table.setUpdatesEnabled(False)
+        self._table.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            self._table.setSortingEnabled(True)
+            self._table.setUpdatesEnabled(True)
+
     def _show_loading(self) -> None:
         self._status_label.setText("Loading...")
         self._status_label.setVisible(True)
 
     def _update_breadcrumb(self) -> None:
-        display_path = f"{self._bucket}/{self._current_prefix}" if self._bucket else ""
-        self._breadcrumb.set_path(display_path)
+        self._breadcrumb.set_path(_display_path(self._bucket, self._current_prefix))
 
     def _on_breadcrumb_clicked(self, path: str) -> None:
         # Strip bucket name from the front to get the prefix
         if self._bucket and path.startswith(self._bucket):
-            prefix = path[len(self._bucket) :]
-            if prefix.startswith("/"):
-                prefix = prefix[1:]
-            if prefix and not prefix.endswith("/"):
-                prefix += "/"
-            # Root is empty string, not "/"
-            if prefix == "/":
-                prefix = ""
-            self.navigate_to(prefix)
+            self.navigate_to(_path_to_prefix(self._bucket, path))
 
     def _on_breadcrumb_edited(self, path: str) -> None:
         # User typed a path — interpret as prefix
-        if self._bucket and path.startswith(self._bucket):
-            prefix = path[len(self._bucket) :]
-            if prefix.startswith("/"):
-                prefix = prefix[1:]
-        else:
-            prefix = path
-        if prefix and not prefix.endswith("/"):
-            prefix += "/"
-        self.navigate_to(prefix)
+        self.navigate_to(_path_to_prefix(self._bucket, path))
 
     def _on_double_click(self, index: QModelIndex) -> None:
         source_idx = self._proxy.mapToSource(index)
@@ -450,68 +723,70 @@ class S3PaneWidget(QWidget):
 
     def _update_footer(self) -> None:
         total = self._model.item_count()
-        visible = self._proxy.rowCount()
-        size_str = _format_size(self._model.total_size())
+        total_size = self._model.total_size()
+        if total_size != self._footer_size_cache[0]:
+            self._footer_size_cache = (total_size, _format_size(total_size))
+        size_str = self._footer_size_cache[1]
 
         if self._filter_bar.isVisible() and self._filter_bar.text():
+            # Only a live filter needs the proxy's visible count; with no
+            # filter the proxy is a pass-through and visible == total
+            visible = self._proxy.rowCount()
             self._footer.setText(f"{visible} of {total} items, {size_str}")
         else:
             self._footer.setText(f"{total} items, {size_str}")
 
-    @staticmethod
-    def _remove_from_list(items: list[S3Item], keys: set[str]) -> None:
-        items[:] = [i for i in items if i.key not in keys]
-
     def _on_context_menu(self, pos) -> None:
-        from PyQt6.QtWidgets import QMenu
-
-        menu = QMenu(self)
         selected = self.selected_items()
-
+        global_pos = self._table.viewport().mapToGlobal(pos)
         if selected:
-            download_action = menu.addAction("Download")
-            download_action.triggered.connect(lambda: self.download_requested.emit(selected))
-
-            menu.addSeparator()
-
-            delete_action = menu.addAction("Delete")
-            delete_action.triggered.connect(lambda: self.delete_requested.emit(selected))
-
-            if len(selected) == 1:
-                menu.addSeparator()
-                info_action = menu.addAction("Get Info")
-                info_action.triggered.connect(lambda: self.get_info_requested.emit(selected[0]))
+            single = len(selected) == 1
+            self._info_separator.setVisible(single)
+            self._info_act.setVisible(single)
+            self._menu_selected.exec(global_pos)
         else:
-            new_folder_action = menu.addAction("New Folder")
-            new_folder_action.triggered.connect(self.new_folder_requested.emit)
+            self._menu_empty.exec(global_pos)
 
-            refresh_action = menu.addAction("Refresh")
-            refresh_action.triggered.connect(self.refresh)
+    def _emit_download_selected(self) -> None:
+        selected = self.selected_items()
+        if selected:
+            self.download_requested.emit(selected)
 
-        menu.exec(self._table.viewport().mapToGlobal(pos))
+    def _emit_delete_selected(self) -> None:
+        selected = self.selected_items()
+        if selected:
+            self.delete_requested.emit(selected)
+
+    def _emit_get_info_selected(self) -> None:
+        selected = self.selected_items()
+        if len(selected) == 1:
+            self.get_info_requested.emit(selected[0])
 
     # --- Operation lock manager ---
 
     def acquire_lock(self, keys: list[str], description: str) -> bool:
-        """Attempt to lock keys for an operation. Returns False if conflict."""
+        """Attempt to lock keys for an operation. Returns False if conflict.
+
+        Conflict checks walk the lock trie once per key, so cost doesn't
+        grow with the number of operations already in flight.
+        """
         for key in keys:
-            for locked_key, locked_desc in self._operation_locks.items():
-                if key.startswith(locked_key) or locked_key.startswith(key):
-                    logger.warning(
-                        "Lock conflict: '%s' blocked by '%s' (%s)",
-                        key,
-                        locked_key,
-                        locked_desc,
-                    )
-                    return False
+            locked_desc = self._operation_locks.find_conflict(key)
+            if locked_desc is not None:
+                logger.warning(
+                    "Lock conflict: '%s' blocked by in-flight operation (%s)",
+                    key,
+                    locked_desc,
+                )
+                return False
         for key in keys:
-            self._operation_locks[key] = description
+            self._operation_locks.insert(key, description)
         return True
 
     def release_lock(self, keys: list[str]) -> None:
         """Release locks for the given keys."""
         for key in keys:
-            self._operation_locks.pop(key, None)
+            self._operation_locks.remove(key)
 
     # --- Drag and drop (via event filter on table viewport) ---
 
@@ -537,11 +812,3 @@ class S3PaneWidget(QWidget):
             return True
 
         return super().eventFilter(obj, event)
-
-    @staticmethod
-    def _rename_in_list(items: list[S3Item], old_key: str, new_key: str, new_name: str) -> None:
-        for item in items:
-            if item.key == old_key:
-                item.key = new_key
-                item.name = new_name
-                break
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -17,6 +17,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QListWidget,
+    QListWidgetItem,
     QMessageBox,
     QPushButton,
     QSpinBox,
@@ -25,9 +26,9 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from s3ui.core.credentials import CredentialStore, KeyringError, Profile, discover_aws_profiles
+from s3ui.core.credentials import CredentialStore, KeyringError, Profile
 from s3ui.db.database import get_bool_pref, get_int_pref, get_pref, set_pref
-from s3ui.ui.setup_wizard import AWS_REGIONS
+from s3ui.ui.setup_wizard import AWS_REGION_INDEX, AWS_REGIONS, _ProfileDiscoveryWorker
 
 if TYPE_CHECKING:
     from s3ui.db.database import Database
@@ -75,14 +76,26 @@ class CredentialsTab(QWidget):
         self._refresh_list()
 
     def _refresh_list(self) -> None:
+        """Repopulate the profile list, discovering AWS CLI profiles off-thread."""
+        self._profile_list.clear()
+        loading = QListWidgetItem("Discovering AWS profiles...")
+        loading.setFlags(Qt.ItemFlag.NoItemFlags)
+        self._profile_list.addItem(loading)
+        self._add_btn.setEnabled(False)
+
+        worker = _ProfileDiscoveryWorker()
+        worker.signals.finished.connect(self._on_profiles_discovered)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_profiles_discovered(self, aws_profiles: list, regions: dict) -> None:
         self._profile_list.clear()
         # Show AWS CLI profiles first
-        aws_profiles = discover_aws_profiles()
         for name in aws_profiles:
             self._profile_list.addItem(f"{name} (AWS CLI)")
         # Then custom profiles from keyring
         for name in self._store.list_profiles():
             self._profile_list.addItem(name)
+        self._add_btn.setEnabled(True)
 
     def _on_selection_changed(self) -> None:
         has_selection = self._profile_list.currentItem() is not None
@@ -172,10 +185,7 @@ class _ProfileEditDialog(QDialog):
         for display_name, region_code in AWS_REGIONS:
             self._region_combo.addItem(f"{display_name} ({region_code})", region_code)
         if profile:
-            for i in range(self._region_combo.count()):
-                if self._region_combo.itemData(i) == profile.region:
-                    self._region_combo.setCurrentIndex(i)
-                    break
+            self._region_combo.setCurrentIndex(AWS_REGION_INDEX.get(profile.region, 0))
         layout.addRow("Region:", self._region_combo)
 
         self._endpoint_edit = QLineEdit()
@@ -350,6 +360,10 @@ class SettingsDialog(QDialog):
         """Return the name of the last profile added in the Credentials tab."""
         return self._cred_tab.last_added_profile
 
+    def reset_last_added_profile(self) -> None:
+        """Clear the last-added marker so a reused instance starts fresh."""
+        self._cred_tab.last_added_profile = None
+
     def _on_accept(self) -> None:
         self._transfers_tab.apply_settings()
         self._general_tab.apply_settings()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -49,6 +49,32 @@ AWS_REGIONS = [
     ("South America (Sao Paulo)", "sa-east-1"),
 ]
 
+# Region code -> combo index, for a dict lookup instead of walking the
+# combo with itemData() calls
+AWS_REGION_INDEX = {code: i for i, (_, code) in enumerate(AWS_REGIONS)}
+
+
+class _DiscoverySignals(QObject):
+    finished = pyqtSignal(list, dict)  # (profile names, {name: region})
+
+
+class _ProfileDiscoveryWorker(QRunnable):
+    """Discovers AWS CLI profiles off the GUI thread.
+
+    The first discovery imports botocore and parses ~/.aws — enough to
+    stutter dialog open, so it runs on the global thread pool and the UI
+    fills in when the results arrive.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _DiscoverySignals()
+
+    def run(self) -> None:
+        profiles = discover_aws_profiles()
+        regions = {name: get_aws_profile_region(name) for name in profiles}
+        self.signals.finished.emit(profiles, regions)
+
 
 class _TestWorkerSignals(QObject):
     finished = pyqtSignal(TestResult)
@@ -162,21 +188,44 @@ class CredentialPage(QWizardPage):
         self._aws_radio.toggled.connect(self._on_mode_changed)
         self._manual_radio.toggled.connect(self._on_mode_changed)
 
-        # Populate AWS profiles (uses pre-discovered list or discovers fresh)
+        # Populate AWS profiles (uses pre-discovered list or discovers in background)
         self._populate_profiles()
 
     def _populate_profiles(self) -> None:
-        """Populate the AWS profile combo with already-discovered profiles."""
-        # If no profiles were passed in, try discovering now
-        if not self._aws_profiles:
-            self._aws_profiles = discover_aws_profiles()
-            logger.debug("Wizard discovered %d AWS profiles", len(self._aws_profiles))
+        """Fill the AWS profile combo, discovering profiles if none were passed in.
+
+        Discovery parses ~/.aws, so when the caller didn't pre-discover it
+        runs on the thread pool; the combo stays disabled with a loading
+        placeholder until :meth:`_on_profiles_discovered` fires.
+        """
+        if self._aws_profiles:
+            regions = {name: get_aws_profile_region(name) for name in self._aws_profiles}
+            self._on_profiles_discovered(self._aws_profiles, regions)
+            return
+
+        self._aws_profile_combo.addItem("Looking for AWS CLI profiles...")
+        self._aws_profile_combo.setEnabled(False)
+        self._aws_radio.setEnabled(False)
+        self._aws_info_label.setText("Looking for AWS CLI profiles...")
+        self._manual_radio.setChecked(True)
+        self._on_mode_changed()
+
+        worker = _ProfileDiscoveryWorker()
+        worker.signals.finished.connect(self._on_profiles_discovered)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_profiles_discovered(self, profiles: list, regions: dict) -> None:
+        """Apply discovery results to the profile combo and radio state."""
+        self._aws_profiles = list(profiles)
+        logger.debug("Wizard discovered %d AWS profiles", len(self._aws_profiles))
 
         self._aws_profile_combo.clear()
 
         if self._aws_profiles:
+            self._aws_profile_combo.setEnabled(True)
+            self._aws_radio.setEnabled(True)
             for name in self._aws_profiles:
-                region = get_aws_profile_region(name)
+                region = regions.get(name, "")
                 display = f"{name} ({region})" if region else name
                 self._aws_profile_combo.addItem(display, name)
             self._aws_info_label.setText(
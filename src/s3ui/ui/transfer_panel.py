@@ -97,6 +97,11 @@ class TransferPanelWidget(QWidget):
         self._model.add_transfer(transfer_id)
         self._update_header()
 
+    def add_transfers(self, transfer_ids: list[int]) -> None:
+        """Add a batch of transfers to the panel with a single model insert."""
+        self._model.add_transfers(transfer_ids)
+        self._update_header()
+
     def _update_header(self) -> None:
         active = self._model.active_count()
         queued = self._model.queued_count()
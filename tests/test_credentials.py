@@ -175,6 +175,28 @@ class TestDiscoverAwsProfiles:
         profiles = discover_aws_profiles()
         assert profiles == sorted(profiles)
 
+    def test_cache_invalidated_when_config_changes(self, tmp_path, monkeypatch):
+        import os
+
+        from s3ui.core import credentials
+
+        config = tmp_path / "config"
+        config.write_text("[profile work]\nregion = eu-west-1\n")
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(config))
+        monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(tmp_path / "credentials"))
+        monkeypatch.setattr(credentials, "_profile_cache", None)
+
+        assert credentials.discover_aws_profiles() == ["work"]
+        assert credentials.get_aws_profile_region("work") == "eu-west-1"
+        assert credentials.get_aws_profile_region("missing") == ""
+
+        config.write_text(
+            "[profile work]\nregion = eu-west-1\n[profile home]\nregion = us-east-1\n"
+        )
+        os.utime(config, ns=(1, 1))  # force a distinct mtime regardless of clock resolution
+        assert credentials.discover_aws_profiles() == ["home", "work"]
+        assert credentials.get_aws_profile_region("home") == "us-east-1"
+
 
 class TestErrorTranslation:
     def test_known_error_codes(self):
@@ -5,7 +5,17 @@ from pathlib import Path
 
 import pytest
 
-from s3ui.db.database import Database, get_bool_pref, get_int_pref, get_pref, set_pref
+from s3ui.db.database import (
+    Database,
+    get_blob_pref,
+    get_bool_pref,
+    get_int_pref,
+    get_pref,
+    get_prefs,
+    set_blob_pref,
+    set_pref,
+    set_prefs,
+)
 
 
 @pytest.fixture
@@ -150,6 +160,25 @@ class TestPreferences:
 
         assert get_bool_pref(db, "missing", default=True) is True
 
+    def test_batch_prefs(self, db: Database):
+        set_prefs(db, {"a": "1", "b": "2"})
+        prefs = get_prefs(db, ["a", "b", "missing"])
+        assert prefs == {"a": "1", "b": "2"}
+
+        assert get_prefs(db, []) == {}
+
+    def test_blob_pref(self, db: Database):
+        set_blob_pref(db, "geometry", b"\x01\x02\xff")
+        assert get_blob_pref(db, "geometry") == b"\x01\x02\xff"
+
+        assert get_blob_pref(db, "missing") is None
+
+    def test_blob_pref_reads_legacy_base64(self, db: Database):
+        import base64
+
+        set_pref(db, "geometry", base64.b64encode(b"\x01\x02\xff").decode())
+        assert get_blob_pref(db, "geometry") == b"\x01\x02\xff"
+
     def test_int_pref(self, db: Database):
         set_pref(db, "count", "42")
         assert get_int_pref(db, "count") == 42
@@ -0,0 +1,52 @@
+"""Tests for KeyTrie."""
+
+from s3ui.core.key_trie import KeyTrie
+
+
+class TestFindConflict:
+    def test_empty_trie_has_no_conflict(self):
+        trie = KeyTrie()
+        assert trie.find_conflict("docs/a.txt") is None
+
+    def test_exact_match_conflicts(self):
+        trie = KeyTrie()
+        trie.insert("docs/a.txt", "download")
+        assert trie.find_conflict("docs/a.txt") == "download"
+
+    def test_ancestor_conflicts(self):
+        trie = KeyTrie()
+        trie.insert("docs/", "delete")
+        assert trie.find_conflict("docs/sub/a.txt") == "delete"
+
+    def test_descendant_conflicts(self):
+        trie = KeyTrie()
+        trie.insert("docs/sub/a.txt", "upload")
+        assert trie.find_conflict("docs/") == "upload"
+
+    def test_sibling_does_not_conflict(self):
+        trie = KeyTrie()
+        trie.insert("docs/a.txt", "download")
+        assert trie.find_conflict("docs/b.txt") is None
+        assert trie.find_conflict("images/") is None
+
+
+class TestRemove:
+    def test_remove_frees_key(self):
+        trie = KeyTrie()
+        trie.insert("docs/a.txt", "download")
+        trie.remove("docs/a.txt")
+        assert trie.find_conflict("docs/a.txt") is None
+
+    def test_remove_keeps_sibling(self):
+        trie = KeyTrie()
+        trie.insert("docs/a.txt", "download")
+        trie.insert("docs/b.txt", "delete")
+        trie.remove("docs/a.txt")
+        assert trie.find_conflict("docs/a.txt") is None
+        assert trie.find_conflict("docs/b.txt") == "delete"
+
+    def test_remove_missing_is_noop(self):
+        trie = KeyTrie()
+        trie.insert("docs/a.txt", "download")
+        trie.remove("docs/never-locked.txt")
+        assert trie.find_conflict("docs/a.txt") == "download"
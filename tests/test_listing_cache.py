@@ -161,3 +161,131 @@ class TestSafeRevalidate:
         assert result is True
         entry = cache.get("a/")
         assert len(entry.items) == 2
+
+
+class TestStalePut:
+    def test_stale_put_backdates_entry(self):
+        cache = ListingCache(stale_seconds=30.0)
+        cache.put("a/", [_item("1")], stale=True)
+        assert cache.get("a/") is not None
+        assert cache.is_stale("a/") is True
+
+    def test_fresh_put_is_not_stale(self):
+        cache = ListingCache(stale_seconds=30.0)
+        cache.put("a/", [_item("1")])
+        assert cache.is_stale("a/") is False
+
+
+class TestPersistentListingCache:
+    def test_round_trip(self, tmp_path):
+        from s3ui.core.persistent_cache import PersistentListingCache
+
+        store = PersistentListingCache(tmp_path / "cache.db")
+        store.store("bucket", "docs/", [_item("a.txt"), _item("b.txt")])
+        store.close()
+
+        reopened = PersistentListingCache(tmp_path / "cache.db")
+        listings = reopened.load_bucket("bucket")
+        assert set(listings) == {"docs/"}
+        assert [i.name for i in listings["docs/"]] == ["a.txt", "b.txt"]
+        reopened.close()
+
+    def test_etag_stable_and_order_independent(self):
+        from s3ui.core.persistent_cache import listing_etag
+
+        a = [_item("1"), _item("2")]
+        b = [_item("2"), _item("1")]
+        assert listing_etag(a) == listing_etag(b)
+        assert listing_etag(a) != listing_etag([_item("1")])
+
+    def test_etag_lookup(self, tmp_path):
+        from s3ui.core.persistent_cache import PersistentListingCache, listing_etag
+
+        store = PersistentListingCache(tmp_path / "cache.db")
+        items = [_item("a.txt")]
+        store.store("bucket", "docs/", items)
+        assert store.etag("bucket", "docs/") == listing_etag(items)
+        assert store.etag("bucket", "missing/") is None
+        store.close()
+
+
+class TestBucketPartitions:
+    def test_partitions_are_independent(self):
+        cache = ListingCache()
+        cache.set_active_bucket("alpha")
+        cache.put("docs/", [_item("a.txt")])
+        cache.set_active_bucket("beta")
+        assert cache.get("docs/") is None
+        cache.put("docs/", [_item("b.txt")])
+        cache.set_active_bucket("alpha")
+        result = cache.get("docs/")
+        assert result is not None
+        assert result.items[0].name == "a.txt"
+
+    def test_returning_to_bucket_is_warm(self):
+        cache = ListingCache()
+        cache.set_active_bucket("alpha")
+        cache.put("docs/", [_item("a.txt")])
+        cache.set_active_bucket("beta")
+        cache.set_active_bucket("alpha")
+        assert len(cache) == 1
+
+    def test_lru_bucket_eviction(self):
+        cache = ListingCache(max_buckets=2)
+        cache.set_active_bucket("alpha")
+        cache.put("docs/", [_item("a.txt")])
+        cache.set_active_bucket("beta")
+        cache.set_active_bucket("gamma")  # pushes "alpha" past the cap
+        cache.set_active_bucket("alpha")
+        assert cache.get("docs/") is None
+
+    def test_invalidate_all_clears_every_partition(self):
+        cache = ListingCache()
+        cache.set_active_bucket("alpha")
+        cache.put("docs/", [_item("a.txt")])
+        cache.set_active_bucket("beta")
+        cache.put("docs/", [_item("b.txt")])
+        cache.invalidate_all()
+        assert cache.get("docs/") is None
+        cache.set_active_bucket("alpha")
+        assert cache.get("docs/") is None
+
+
+class TestDirectMutations:
+    def test_append_item(self):
+        cache = ListingCache()
+        cache.put("prefix/", [_item("a.txt")])
+        assert cache.append_item("prefix/", _item("b.txt"))
+        entry = cache.get("prefix/")
+        assert len(entry.items) == 2
+        assert entry.dirty
+        assert entry.mutation_counter == 1
+
+    def test_append_items_single_counter_bump(self):
+        cache = ListingCache()
+        cache.put("prefix/", [])
+        cache.append_items("prefix/", [_item("a.txt"), _item("b.txt"), _item("c.txt")])
+        entry = cache.get("prefix/")
+        assert len(entry.items) == 3
+        assert entry.mutation_counter == 1
+
+    def test_remove_keys(self):
+        cache = ListingCache()
+        cache.put("prefix/", [_item("a.txt"), _item("b.txt"), _item("c.txt")])
+        cache.remove_keys("prefix/", {"a.txt", "c.txt"})
+        entry = cache.get("prefix/")
+        assert [i.name for i in entry.items] == ["b.txt"]
+
+    def test_rename_key(self):
+        cache = ListingCache()
+        cache.put("prefix/", [_item("a.txt")])
+        cache.rename_key("prefix/", "a.txt", "z.txt", "z.txt")
+        entry = cache.get("prefix/")
+        assert entry.items[0].key == "z.txt"
+        assert entry.items[0].name == "z.txt"
+
+    def test_uncached_prefix_returns_false(self):
+        cache = ListingCache()
+        assert not cache.append_item("missing/", _item("a.txt"))
+        assert not cache.remove_keys("missing/", {"a.txt"})
+        assert not cache.rename_key("missing/", "a", "b", "b")
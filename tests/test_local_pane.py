@@ -1,5 +1,8 @@
 """Tests for local pane and breadcrumb bar."""
 
+from PyQt6.QtCore import QModelIndex, Qt
+
+from s3ui.models.scandir_model import COL_NAME, COL_SIZE, ScanDirModel
 from s3ui.ui.breadcrumb_bar import BreadcrumbBar
 from s3ui.ui.local_pane import LocalPaneWidget, _format_size
 
@@ -82,6 +85,73 @@ class TestLocalPaneWidget:
         pane.set_show_hidden(False)
         # No crash is the test
 
+    def test_set_model_toggle(self, qtbot, tmp_path):
+        pane = LocalPaneWidget()
+        qtbot.addWidget(pane)
+        (tmp_path / "f.txt").write_text("x")
+        pane.navigate_to(str(tmp_path))
+
+        pane.set_model("scandir")
+        assert isinstance(pane._tree.model(), ScanDirModel)
+        assert pane._tree.model().rowCount() == 1
+
+        pane.set_model("native")
+        assert pane._tree.model() is pane._model
+
+
+class TestScanDirModel:
+    def _make_model(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.txt").write_bytes(b"x" * 100)
+        (tmp_path / "b.txt").write_bytes(b"x" * 2048)
+        model = ScanDirModel()
+        model.set_directory(str(tmp_path))
+        return model
+
+    def test_lists_entries(self, qtbot, tmp_path):
+        model = self._make_model(tmp_path)
+        assert model.rowCount() == 3
+        assert model.columnCount() == 3
+
+    def test_dirs_sort_first(self, qtbot, tmp_path):
+        model = self._make_model(tmp_path)
+        first = model.index(0, COL_NAME)
+        assert model.data(first) == "sub"
+        assert model.isDir(first)
+
+    def test_size_column_formats(self, qtbot, tmp_path):
+        model = self._make_model(tmp_path)
+        by_name = {
+            model.data(model.index(row, COL_NAME)): model.data(model.index(row, COL_SIZE))
+            for row in range(model.rowCount())
+        }
+        assert by_name["a.txt"] == "100 B"
+        assert by_name["b.txt"] == "2.0 KB"
+        assert by_name["sub"] == ""
+
+    def test_sort_by_size(self, qtbot, tmp_path):
+        model = self._make_model(tmp_path)
+        model.sort(COL_SIZE, Qt.SortOrder.DescendingOrder)
+        assert model.data(model.index(0, COL_NAME)) == "b.txt"
+
+    def test_file_path(self, qtbot, tmp_path):
+        model = self._make_model(tmp_path)
+        idx = model.index(0, COL_NAME)
+        assert model.filePath(idx) == str(tmp_path / "sub")
+
+    def test_hidden_files_excluded(self, qtbot, tmp_path):
+        (tmp_path / ".hidden").write_text("x")
+        model = self._make_model(tmp_path)
+        assert model.rowCount() == 3
+        model.set_show_hidden(True)
+        assert model.rowCount() == 4
+
+    def test_flat_hierarchy(self, qtbot, tmp_path):
+        model = self._make_model(tmp_path)
+        idx = model.index(0, COL_NAME)
+        assert model.parent(idx) == QModelIndex()
+        assert model.rowCount(idx) == 0
+
 
 class TestFormatSize:
     def test_bytes(self):
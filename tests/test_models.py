@@ -191,12 +191,32 @@ class TestS3ObjectModel:
         assert len(signals) == 1
         assert signals[0] == (0, 0)
 
+    def test_update_item_rekeys_index(self, qtbot):
+        model = S3ObjectModel()
+        model.set_items([_make_item("a.txt"), _make_item("c.txt")])
+        model.update_item("a.txt", key="b.txt", name="b.txt")
+        # Delete-after-rename must resolve the new key, not the old one
+        assert model.remove_item("a.txt") is False
+        assert model.remove_item("b.txt") is True
+        assert model.rowCount() == 1
+
     def test_append_items(self, qtbot):
         model = S3ObjectModel()
         model.set_items([_make_item("a.txt")])
         model.append_items([_make_item("b.txt"), _make_item("c.txt")])
         assert model.rowCount() == 3
 
+    def test_insert_items_batch_sorted(self, qtbot):
+        model = S3ObjectModel()
+        model.set_items([_make_item("b.txt"), _make_item("e.txt")])
+        model.insert_items([_make_item("d.txt"), _make_item("a.txt"), _make_item("c.txt")])
+        names = [model.get_item(i).name for i in range(model.rowCount())]
+        assert names == ["a.txt", "b.txt", "c.txt", "d.txt", "e.txt"]
+        # Index stays consistent after the batch splice
+        assert model.remove_item("c.txt") is True
+        names = [model.get_item(i).name for i in range(model.rowCount())]
+        assert names == ["a.txt", "b.txt", "d.txt", "e.txt"]
+
     def test_diff_apply_add_and_remove(self, qtbot):
         model = S3ObjectModel()
         model.set_items([_make_item("a.txt"), _make_item("b.txt")])
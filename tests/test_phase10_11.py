@@ -122,7 +122,7 @@ class TestQuickOpen:
         # Create a fake temp file
         temp = tmp_path / "temp_download.txt"
         temp.write_text("test")
-        window._temp_files.append(str(temp))
+        window._temp_files.add(str(temp))
 
         window._cleanup_temp_files()
         assert not temp.exists()
@@ -218,6 +218,31 @@ class TestTransferModelColumnFix:
         assert row.total_bytes == 1000
         assert row.transferred_bytes == 500
 
+    def test_add_transfers_batch(self, db):
+        """add_transfers inserts all rows in order with one model insert."""
+        bucket_id = db.execute(
+            "INSERT INTO buckets (name, region, profile) VALUES (?, ?, ?)",
+            ("test-bucket", "us-east-1", "test"),
+        ).lastrowid
+
+        tids = [
+            db.execute(
+                "INSERT INTO transfers "
+                "(bucket_id, object_key, direction, local_path, status, total_bytes, transferred) "
+                "VALUES (?, ?, 'upload', ?, 'queued', 1000, 0)",
+                (bucket_id, f"file{i}.txt", f"/tmp/file{i}.txt"),
+            ).lastrowid
+            for i in range(3)
+        ]
+
+        from s3ui.models.transfer_model import TransferModel
+
+        model = TransferModel(db=db)
+        model.add_transfers(tids)
+
+        assert model.rowCount() == 3
+        assert [model.get_transfer_row(tid).transfer_id for tid in tids] == tids
+
 
 class TestConnectionFlow:
     """Tests for profile discovery, connection, and bucket selection."""
@@ -298,7 +323,7 @@ class TestConnectionFlow:
 
         with patch("s3ui.main_window.S3Client", return_value=mock_client):
             worker = _ConnectWorker(profile)
-            with qtbot.waitSignal(worker.signals.connected, timeout=5000) as sig:
+            with qtbot.waitSignal(worker.connected, timeout=5000) as sig:
                 worker.start()
 
         worker.wait(5000)  # join thread before it goes out of scope
@@ -317,7 +342,7 @@ class TestConnectionFlow:
 
         with patch("s3ui.main_window.S3Client", side_effect=S3ClientError("Bad key", "detail")):
             worker = _ConnectWorker(profile)
-            with qtbot.waitSignal(worker.signals.failed, timeout=5000) as sig:
+            with qtbot.waitSignal(worker.failed, timeout=5000) as sig:
                 worker.start()
 
         worker.wait(5000)  # join thread before it goes out of scope
@@ -423,7 +448,7 @@ class TestConnectionFlow:
         window = MainWindow(db=db)
         qtbot.addWidget(window)
 
-        with patch("s3ui.main_window.SettingsDialog") as MockDialog:
+        with patch("s3ui.ui.settings_dialog.SettingsDialog") as MockDialog:
             MockDialog.return_value.exec.return_value = 0
             window._open_settings()
             MockDialog.assert_called_once_with(store=window._store, db=db, parent=window)
@@ -61,6 +61,30 @@ class TestListObjects:
         objects, _ = client.list_objects("test-bucket")
         assert len(objects) == 1050
 
+    def test_on_page_callback_receives_every_item(self, s3_env):
+        client, raw = s3_env
+        raw.put_object(Bucket="test-bucket", Key="file1.txt", Body=b"hello")
+        raw.put_object(Bucket="test-bucket", Key="folder/file2.txt", Body=b"world")
+
+        pages = []
+        objects, _ = client.list_objects("test-bucket", on_page=pages.append)
+        streamed = {item.name for page in pages for item in page}
+        assert streamed == {o.name for o in objects}
+
+    def test_large_listing_fanout_under_prefix(self, s3_env):
+        client, raw = s3_env
+        # Spread keys across the fanout split boundaries under a non-root
+        # prefix; every key must come back exactly once
+        for i in range(1200):
+            raw.put_object(
+                Bucket="test-bucket",
+                Key=f"data/{chr(97 + i % 26)}{i:04d}.txt",
+                Body=b"x",
+            )
+        objects, _ = client.list_objects("test-bucket", prefix="data/")
+        assert len(objects) == 1200
+        assert len({o.key for o in objects}) == 1200
+
     def test_prefix_filtering(self, s3_env):
         client, raw = s3_env
         raw.put_object(Bucket="test-bucket", Key="a/1.txt", Body=b"1")
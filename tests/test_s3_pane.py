@@ -136,6 +136,78 @@ class TestOptimisticMutations:
         assert found
 
 
+class TestPageStreaming:
+    def test_pages_fill_view_progressively(self, qtbot):
+        pane = S3PaneWidget()
+        qtbot.addWidget(pane)
+        pane.set_client(_mock_client())
+        pane._bucket = "test-bucket"
+        pane._fetch_id = 1
+        items = _make_items()
+
+        pane._on_page_ready("", items[:2], True, 1)
+        assert pane._model.item_count() == 2
+        pane._on_page_ready("", items[2:], False, 1)
+        assert pane._model.item_count() == 3
+
+    def test_stale_page_is_ignored(self, qtbot):
+        pane = S3PaneWidget()
+        qtbot.addWidget(pane)
+        pane.set_client(_mock_client())
+        pane._bucket = "test-bucket"
+        pane._fetch_id = 2
+
+        pane._on_page_ready("", _make_items(), True, 1)
+        assert pane._model.item_count() == 0
+
+    def test_page_for_other_prefix_is_ignored(self, qtbot):
+        pane = S3PaneWidget()
+        qtbot.addWidget(pane)
+        pane.set_client(_mock_client())
+        pane._bucket = "test-bucket"
+        pane._fetch_id = 1
+        pane._current_prefix = "docs/"
+
+        pane._on_page_ready("", _make_items(), True, 1)
+        assert pane._model.item_count() == 0
+
+
+class TestFetchDropped:
+    def test_drop_relaunches_coalesced_user_fetch(self, qtbot):
+        """A navigation coalesced onto a dropped prefetch must not strand the pane."""
+        pane = S3PaneWidget()
+        qtbot.addWidget(pane)
+        pane.set_client(_mock_client())
+        pane._bucket = "test-bucket"
+        pane._current_prefix = "docs/"
+        pane._fetch_id = 3
+        pane._inflight[("test-bucket", "docs/")] = 3
+        # Record instead of starting a real worker — a live runnable would
+        # outlast the test and deadlock the pane's refcount teardown
+        relaunched = []
+        pane._launch_fetch = relaunched.append
+
+        pane._on_fetch_dropped("docs/", -1)
+        # Relaunched as a fresh mandatory fetch instead of stuck on "Loading..."
+        assert relaunched == ["docs/"]
+        assert ("test-bucket", "docs/") not in pane._inflight
+
+    def test_drop_with_cached_listing_stays_dropped(self, qtbot):
+        """A dropped revalidation of a cached prefix is not promoted to a fetch."""
+        pane = S3PaneWidget()
+        qtbot.addWidget(pane)
+        pane.set_client(_mock_client())
+        pane._bucket = "test-bucket"
+        pane._cache.put("docs/", _make_items())
+        pane._current_prefix = "docs/"
+        pane._fetch_id = 3
+        pane._inflight[("test-bucket", "docs/")] = 3
+
+        pane._on_fetch_dropped("docs/", 3)
+        assert ("test-bucket", "docs/") not in pane._inflight
+        assert pane._fetch_id == 3
+
+
 class TestFilter:
     def test_filter_by_name(self, qtbot):
         pane = S3PaneWidget()
@@ -146,7 +218,7 @@ class TestFilter:
 
         pane._filter_bar.setVisible(True)
         pane._filter_bar.setText("readme")
-        # Proxy should filter
+        pane._apply_filter()  # keystrokes are debounced; flush directly
         assert pane._proxy.rowCount() == 1
 
     def test_clear_filter_shows_all(self, qtbot):
@@ -158,7 +230,9 @@ class TestFilter:
 
         pane._filter_bar.setVisible(True)
         pane._filter_bar.setText("readme")
+        pane._apply_filter()
         assert pane._proxy.rowCount() == 1
 
         pane._filter_bar.clear()
+        pane._apply_filter()
         assert pane._proxy.rowCount() == 3
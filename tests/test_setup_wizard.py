@@ -64,6 +64,30 @@ class TestCredentialPage:
         # When no profiles, returns fallback
         assert profile is not None
 
+    def test_combo_disabled_while_discovering(self, qtbot):
+        """Without pre-discovered profiles the combo waits on the worker."""
+        store = CredentialStore()
+        page = CredentialPage(store)
+        qtbot.addWidget(page)
+        assert page._aws_profile_combo.isEnabled() is False
+        assert page._manual_radio.isChecked() is True
+
+    def test_discovery_results_populate_combo(self, qtbot):
+        store = CredentialStore()
+        page = CredentialPage(store)
+        qtbot.addWidget(page)
+        page._on_profiles_discovered(["work"], {"work": "eu-west-1"})
+        assert page._aws_profile_combo.isEnabled() is True
+        assert page._aws_profile_combo.itemText(0) == "work (eu-west-1)"
+        assert page._aws_radio.isChecked() is True
+
+    def test_pre_discovered_profiles_populate_synchronously(self, qtbot):
+        store = CredentialStore()
+        page = CredentialPage(store, aws_profiles=["default"])
+        qtbot.addWidget(page)
+        assert page._aws_profile_combo.itemData(0) == "default"
+        assert page._aws_radio.isChecked() is True
+
 
 class TestBucketPage:
     def test_creates(self, qtbot):
@@ -175,6 +199,15 @@ class TestCredentialsTab:
         qtbot.addWidget(tab)
         assert tab._add_btn.text() == "Add Profile..."
 
+    def test_discovery_results_fill_list(self, qtbot):
+        store = CredentialStore()
+        tab = CredentialsTab(store)
+        qtbot.addWidget(tab)
+        tab._on_profiles_discovered(["work"], {"work": "eu-west-1"})
+        assert tab._profile_list.count() == 1
+        assert tab._profile_list.item(0).text() == "work (AWS CLI)"
+        assert tab._add_btn.isEnabled() is True
+
 
 class TestTransfersTab:
     def test_creates(self, qtbot):
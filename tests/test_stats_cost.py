@@ -47,7 +47,7 @@ class TestCostDialog:
     def test_daily_table_columns(self, qtbot):
         dialog = CostDialog()
         qtbot.addWidget(dialog)
-        assert dialog._daily_table.columnCount() == 5
+        assert dialog._daily_table.model().columnCount() == 5
 
     def test_loads_with_tracker(self, qtbot, tmp_path):
         """CostDialog loads data when given a real CostTracker."""
@@ -63,7 +63,7 @@ class TestCostDialog:
         qtbot.addWidget(dialog)
 
         assert "$" in dialog._estimate_label.text()
-        assert dialog._daily_table.rowCount() > 0
+        assert dialog._daily_table.model().rowCount() > 0
         db.close()
 
     def test_export_csv(self, qtbot, tmp_path):
@@ -90,6 +90,8 @@ class TestCostDialog:
         ):
             dialog._export_csv()
 
+        # The file is written on a pool thread; wait for it to land
+        qtbot.waitUntil(lambda: csv_path.exists() and "total_cost" in csv_path.read_text())
         content = csv_path.read_text()
         assert "date," in content
         assert "total_cost" in content
@@ -107,8 +107,7 @@ class TestTransferModel:
         # Manually add a row
         row = TransferRow(1, "upload", "f.txt", "/f.txt", "f.txt", 1000)
         model.beginInsertRows(model._EMPTY_INDEX, 0, 0)
-        model._rows.append(row)
-        model._id_to_row[1] = 0
+        model._append_row(row)
         model.endInsertRows()
 
         model.on_progress(1, 500, 1000)
@@ -121,8 +120,7 @@ class TestTransferModel:
         model = TransferModel()
         row = TransferRow(1, "upload", "f.txt", "/f.txt", "f.txt", 1000, status="in_progress")
         model.beginInsertRows(model._EMPTY_INDEX, 0, 0)
-        model._rows.append(row)
-        model._id_to_row[1] = 0
+        model._append_row(row)
         model.endInsertRows()
 
         model.on_finished(1)
@@ -137,9 +135,8 @@ class TestTransferModel:
             TransferRow(3, "upload", "c.txt", "/c", "c", 100, status="completed"),
         ]
         model.beginInsertRows(model._EMPTY_INDEX, 0, 2)
-        model._rows.extend(rows)
-        for i, r in enumerate(rows):
-            model._id_to_row[r.transfer_id] = i
+        for r in rows:
+            model._append_row(r)
         model.endInsertRows()
 
         assert model.active_count() == 1